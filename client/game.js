@@ -2,6 +2,10 @@
 let socket = null;
 let gameState = null;
 let currentGameId = null;
+let stateSeq = 0;             // Sequence number of the last state broadcast applied
+let stateResyncPending = false;
+let stateResyncTimer = null;   // Gives up on an unanswered get_game_state so the next delta can retry
+const STATE_RESYNC_TIMEOUT_MS = 5000;
 // Note: We track current player through socket.id directly, not this variable
 // let currentPlayerId = null; // Removed - using socket.id directly instead
 let selectedFloor = 2;
@@ -109,20 +113,60 @@ function connectToServer() {
         const message = data.auto_started ? 'Game auto-started!' : 'Game started!';
         addLog(message, 'action');
         gameState = data.game_state;
+        stateSeq = data.seq;
         document.getElementById('startGameBtn').style.display = 'none';
         hideLobbyStatus(); // Hide lobby status when game starts
         updateGameDisplay();
         updateActionButtons();
     });
     
+    // Full state snapshot (reply to get_game_state)
     socket.on('game_state_update', function(data) {
-        const oldState = gameState ? gameState.state : null;
-        gameState = data.game_state;
-        
+        stateSeq = data.seq;
+        endStateResync();
+        applyGameState(data.game_state);
+    });
+    
+    // Top-level fields changed by an action; deltas must be applied in sequence
+    socket.on('game_state_delta', function(data) {
         if (data.action_result) {
             addLog(`Action: ${JSON.stringify(data.action_result)}`, 'action');
+            // The broadcast doubles as the acting player's ack; failed actions arrive as 'error'
+            if (data.actor === socket.id) {
+                addLog(`Action successful: ${data.action_result.message || 'Action completed'}`, 'action');
+            }
+        }
+        
+        if (stateResyncPending || data.seq <= stateSeq) {
+            return;
+        }
+        if (!gameState || data.seq !== stateSeq + 1) {
+            // Missed a delta: fetch the latest snapshot, later deltas continue from it
+            startStateResync(data.game_id);
+            return;
         }
         
+        stateSeq = data.seq;
+        applyGameState({ ...gameState, ...data.changed });
+    });
+    
+    function startStateResync(gameId) {
+        stateResyncPending = true;
+        clearTimeout(stateResyncTimer);
+        stateResyncTimer = setTimeout(endStateResync, STATE_RESYNC_TIMEOUT_MS);
+        socket.emit('get_game_state', { game_id: gameId });
+    }
+    
+    function endStateResync() {
+        stateResyncPending = false;
+        clearTimeout(stateResyncTimer);
+        stateResyncTimer = null;
+    }
+    
+    function applyGameState(newState) {
+        const oldState = gameState ? gameState.state : null;
+        gameState = newState;
+        
         // Check for state transitions
         if (oldState === 'pawn_placement' && gameState.state === 'playing') {
             addLog('🎮 All pawns placed! Normal gameplay begins!', 'success');
@@ -139,7 +183,7 @@ function connectToServer() {
         
         updateGameDisplay();
         updateActionButtons();
-    });
+    }
     
     // Enhanced dice roll event handler
     socket.on('dice_roll', function(data) {
@@ -172,18 +216,15 @@ function connectToServer() {
         }
     });
     
-    socket.on('action_result', function(data) {
-        if (data.success) {
-            addLog(`Action successful: ${data.message || 'Action completed'}`, 'action');
-        } else {
-            addLog(`Action failed: ${data.reason}`, 'error');
-        }
-    });
-    
     socket.on('error', function(data) {
         const errorMessage = data.message || data.reason || 'Unknown server error';
         addLog(`Server Error: ${errorMessage}`, 'error');
         console.error('Socket error:', data);
+        
+        // A failed get_game_state must not leave deltas ignored; the next one requests a snapshot again
+        if (stateResyncPending) {
+            endStateResync();
+        }
     });
     
     // Enhanced connection event handlers
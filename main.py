@@ -4,9 +4,8 @@ Main launcher for NMB Game development environment.
 Automatically starts both backend and frontend servers.
 """
 
-import subprocess
-import threading
-import time
+import asyncio
+import urllib.request
 import webbrowser
 import signal
 import sys
@@ -23,56 +22,59 @@ class GameServerLauncher:
         self.backend_process = None
         self.frontend_process = None
         self.running = False
+        self.output_tasks = []
+        
+    async def _spawn(self, script, cwd, label):
+        """Start a child Python process and echo its output with a label prefix"""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, script,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        
+        # Drain output on the event loop instead of a monitor thread
+        self.output_tasks.append(asyncio.create_task(self._drain_output(process.stdout, label)))
+        return process
+        
+    async def _drain_output(self, stream, label):
+        """Print every non-empty line a child process writes"""
+        async for line in stream:
+            text = line.decode(errors="replace").strip()
+            if text:
+                print(f"[{label}] {text}")
         
-    def start_backend(self):
+    async def start_backend(self):
         """Start the Flask/SocketIO backend server"""
         print(f"[BACKEND] Starting backend server on port {BACKEND_PORT}...")
         
         # Change to server directory and start
         backend_dir = Path(__file__).parent / "server"
-        self.backend_process = subprocess.Popen(
-            [sys.executable, "run.py"],
-            cwd=backend_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
-        
-        # Monitor backend output in a separate thread
-        def monitor_backend():
-            for line in iter(self.backend_process.stdout.readline, ''):
-                if line.strip():
-                    print(f"[BACKEND] {line.strip()}")
+        self.backend_process = await self._spawn("run.py", backend_dir, "BACKEND")
         
-        threading.Thread(target=monitor_backend, daemon=True).start()
-        
-    def start_frontend(self):
+    async def start_frontend(self):
         """Start the frontend HTTP server"""
         print(f"[FRONTEND] Starting frontend server on port {FRONTEND_PORT}...")
         
         # Change to client directory and start
         client_dir = Path(__file__).parent / "client"
-        self.frontend_process = subprocess.Popen(
-            [sys.executable, "serve.py"],
-            cwd=client_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
+        self.frontend_process = await self._spawn("serve.py", client_dir, "FRONTEND")
         
-        # Monitor frontend output in a separate thread
-        def monitor_frontend():
-            for line in iter(self.frontend_process.stdout.readline, ''):
-                if line.strip():
-                    print(f"[FRONTEND] {line.strip()}")
+    def _fetch(self, url):
+        """Request a URL, raising if the server cannot answer it"""
+        with urllib.request.urlopen(url, timeout=1):
+            pass
         
-        threading.Thread(target=monitor_frontend, daemon=True).start()
+    async def _is_serving(self, url):
+        """Check whether a server answers an HTTP request (a bound socket alone is not enough)"""
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._fetch, url)
+        except OSError:
+            return False
+        return True
         
-    def wait_for_servers(self):
+    async def wait_for_servers(self):
         """Wait for both servers to be ready"""
         print("[WAIT] Waiting for servers to start...")
         
@@ -81,26 +83,17 @@ class GameServerLauncher:
         frontend_ready = False
         
         for attempt in range(30):  # 30 seconds timeout
-            time.sleep(1)
+            await asyncio.sleep(1)
             
             # Check backend
-            if not backend_ready:
-                try:
-                    import urllib.request
-                    urllib.request.urlopen(f"http://localhost:{BACKEND_PORT}/health", timeout=1)
-                    backend_ready = True
-                    print("[OK] Backend server is ready!")
-                except:
-                    pass
+            if not backend_ready and await self._is_serving(f"http://localhost:{BACKEND_PORT}/health"):
+                backend_ready = True
+                print("[OK] Backend server is ready!")
             
             # Check frontend  
-            if not frontend_ready:
-                try:
-                    urllib.request.urlopen(f"http://localhost:{FRONTEND_PORT}", timeout=1)
-                    frontend_ready = True
-                    print("[OK] Frontend server is ready!")
-                except:
-                    pass
+            if not frontend_ready and await self._is_serving(f"http://localhost:{FRONTEND_PORT}"):
+                frontend_ready = True
+                print("[OK] Frontend server is ready!")
             
             if backend_ready and frontend_ready:
                 break
@@ -112,87 +105,92 @@ class GameServerLauncher:
         print(f"[GAME] Opening game at {GAME_URL}")
         webbrowser.open(GAME_URL)
         
-    def cleanup(self):
+    async def _stop_process(self, process, name):
+        """Terminate a child process, killing it if it does not exit in time"""
+        if not process or process.returncode is not None:
+            return
+        
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        print(f"[STOP] {name} server stopped")
+        
+    async def cleanup(self):
         """Clean up processes on exit"""
         print("\n[STOP] Shutting down servers...")
         
-        if self.backend_process:
-            self.backend_process.terminate()
-            try:
-                self.backend_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.backend_process.kill()
-            print("[STOP] Backend server stopped")
-            
-        if self.frontend_process:
-            self.frontend_process.terminate()
-            try:
-                self.frontend_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.frontend_process.kill()
-            print("[STOP] Frontend server stopped")
+        await self._stop_process(self.backend_process, "Backend")
+        await self._stop_process(self.frontend_process, "Frontend")
+        
+        for task in self.output_tasks:
+            task.cancel()
             
         self.running = False
         
-    def run(self):
-        """Main run method"""
+    async def _run(self):
+        """Start both servers and supervise them until one exits or we are stopped"""
+        self.running = True
+        loop = asyncio.get_running_loop()
+        
+        # Setup signal handler for clean shutdown (not available on Windows)
+        try:
+            loop.add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except (NotImplementedError, AttributeError):
+            pass
+        
         try:
-            self.running = True
-            
-            # Setup signal handler for clean shutdown
-            def signal_handler(signum, frame):
-                self.cleanup()
-                sys.exit(0)
-                
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
-            
             print("NMB Game Development Server")
             print("=" * 50)
             
             # Start both servers
-            self.start_backend()
-            time.sleep(2)  # Give backend a head start
-            self.start_frontend()
+            await self.start_backend()
+            await asyncio.sleep(0.5)  # Give backend a head start; readiness is probed below
+            await self.start_frontend()
             
             # Wait for servers to be ready
-            if self.wait_for_servers():
-                print("\n[SUCCESS] All servers ready!")
-                print(f"[GAME] Game URL: {GAME_URL}")
-                print(f"[API] Backend API: http://localhost:{BACKEND_PORT}")
-                print(f"[WEB] Frontend: http://localhost:{FRONTEND_PORT}")
-                print("\n[INFO] Instructions:")
-                print("   1. The game will open automatically in your browser")
-                print("   2. Create or join a game to start playing")
-                print("   3. Press Ctrl+C to stop all servers")
-                print("\n" + "=" * 50)
-                
-                # Auto-open browser after a short delay
-                threading.Timer(3.0, self.open_game).start()
-                
-                # Keep main thread alive
-                while self.running:
-                    time.sleep(1)
-                    
-                    # Check if processes are still alive
-                    if self.backend_process and self.backend_process.poll() is not None:
-                        print("[ERROR] Backend server crashed!")
-                        break
-                    if self.frontend_process and self.frontend_process.poll() is not None:
-                        print("[ERROR] Frontend server crashed!")
-                        break
-                        
-            else:
+            if not await self.wait_for_servers():
                 print("[ERROR] Failed to start servers within timeout")
-                self.cleanup()
                 return False
-                
-        except KeyboardInterrupt:
+            
+            print("\n[SUCCESS] All servers ready!")
+            print(f"[GAME] Game URL: {GAME_URL}")
+            print(f"[API] Backend API: http://localhost:{BACKEND_PORT}")
+            print(f"[WEB] Frontend: http://localhost:{FRONTEND_PORT}")
+            print("\n[INFO] Instructions:")
+            print("   1. The game will open automatically in your browser")
+            print("   2. Create or join a game to start playing")
+            print("   3. Press Ctrl+C to stop all servers")
+            print("\n" + "=" * 50)
+            
+            # Auto-open browser after a short delay
+            loop.call_later(3.0, self.open_game)
+            
+            # Block until either server exits
+            backend_exit = asyncio.create_task(self.backend_process.wait())
+            frontend_exit = asyncio.create_task(self.frontend_process.wait())
+            await asyncio.wait({backend_exit, frontend_exit}, return_when=asyncio.FIRST_COMPLETED)
+            
+            if backend_exit.done():
+                print("[ERROR] Backend server crashed!")
+            if frontend_exit.done():
+                print("[ERROR] Frontend server crashed!")
+            frontend_exit.cancel()
+            backend_exit.cancel()
+            return True
+        finally:
+            await self.cleanup()
+        
+    def run(self):
+        """Main run method"""
+        try:
+            return asyncio.run(self._run())
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n[STOP] Received shutdown signal")
         except Exception as e:
             print(f"[ERROR] Error: {e}")
-        finally:
-            self.cleanup()
             
         return True
 
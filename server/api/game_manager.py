@@ -4,7 +4,7 @@ Manages game creation, player joining, and routing actions to correct games.
 """
 
 import uuid
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from datetime import datetime
 import logging
 import sys
@@ -23,12 +23,18 @@ class GameManager:
     def __init__(self, socketio=None):
         self.games: Dict[str, Game] = {}  # game_id -> Game instance
         self.player_to_game: Dict[str, str] = {}    # socket_id -> game_id
+        self.player_games: Dict[str, Game] = {}     # socket_id -> Game instance (per-action shortcut)
+        self.last_broadcast_states: Dict[str, Dict[str, Any]] = {}  # game_id -> last state sent to room
+        self.broadcast_seqs: Dict[str, int] = {}  # game_id -> sequence number of that broadcast
+        self._state_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}  # game_id -> (state_version, state)
+        self._valid_actions_cache: Dict[str, Tuple[int, List[str]]] = {}  # socket_id -> (state_version, actions)
+        self._lobby_cache: Optional[Dict[str, Any]] = None  # Rebuilt lazily by get_game_list
         self.max_players = 4
         self.socketio = socketio
         
     def create_game(self, player_name: str, socket_id: str) -> str:
         """Create a new game session"""
-        game_id = str(uuid.uuid4())[:6].upper()  # 6-character game ID
+        game_id = sys.intern(str(uuid.uuid4())[:6].upper())  # 6-character game ID, interned like validated IDs
         
         # Create new Game instance
         game = Game(game_id, self.max_players)
@@ -46,8 +52,10 @@ class GameManager:
         # Store game and player mapping
         self.games[game_id] = game
         self.player_to_game[socket_id] = game_id
+        self.player_games[socket_id] = game
+        self._lobby_cache = None
         
-        logging.info(f"Game {game_id} created by {player_name}")
+        logging.info("Game %s created by %s", game_id, player_name)
         return game_id
     
     def game_exists(self, game_id: str) -> bool:
@@ -69,9 +77,13 @@ class GameManager:
         player = Player(player_name, socket_id)
         success = game.add_player(player)
         
+        game.state_version += 1
+        
         if success:
             self.player_to_game[socket_id] = game_id
-            logging.info(f"Player {player_name} joined game {game_id}")
+            self.player_games[socket_id] = game
+            self._lobby_cache = None
+            logging.info("Player %s joined game %s", player_name, game_id)
             
             # Check for auto-start if enabled
             should_auto_start = False
@@ -88,35 +100,89 @@ class GameManager:
         
         return {"success": False, "reason": "Failed to join game"}
     
-    def leave_game(self, socket_id: str) -> Optional[str]:
-        """Remove a player from their current game"""
+    def leave_game(self, socket_id: str) -> Tuple[Optional[str], int]:
+        """Remove a player from their current game.
+        
+        Returns (game_id, remaining player count); game_id is None if the player was in no game.
+        """
         if socket_id not in self.player_to_game:
-            return None
+            return None, 0
             
         game_id = self.player_to_game[socket_id]
+        remaining = 0
         
         if game_id in self.games:
             game = self.games[game_id]
             removed_player = game.remove_player(socket_id)
+            game.state_version += 1
+            remaining = len(game.players)
             
             if removed_player:
-                logging.info(f"Player {removed_player.name} left game {game_id}")
+                self._lobby_cache = None
+                logging.info("Player %s left game %s", removed_player.name, game_id)
                 
                 # If no players left, delete the game
                 if not game.players:
                     del self.games[game_id]
-                    logging.info(f"Game {game_id} deleted (no players remaining)")
+                    self.last_broadcast_states.pop(game_id, None)
+                    self.broadcast_seqs.pop(game_id, None)
+                    self._state_cache.pop(game_id, None)
+                    logging.info("Game %s deleted (no players remaining)", game_id)
         
         del self.player_to_game[socket_id]
-        return game_id
+        self.player_games.pop(socket_id, None)
+        self._valid_actions_cache.pop(socket_id, None)
+        return game_id, remaining
     
     def get_game_state(self, game_id: str) -> Optional[Dict[str, Any]]:
         """Get current state of a game"""
         if game_id not in self.games:
             return None
             
-        game = self.games[game_id]
-        return game.get_game_state()
+        return self._get_cached_state(self.games[game_id])
+    
+    def _get_cached_state(self, game: Game) -> Dict[str, Any]:
+        """Build a game's state at most once per state_version.
+        
+        Callers share the returned dict, so it must not be modified.
+        """
+        cached = self._state_cache.get(game.game_id)
+        if cached is not None and cached[0] == game.state_version:
+            return cached[1]
+        
+        state = game.get_game_state()
+        self._state_cache[game.game_id] = (game.state_version, state)
+        return state
+    
+    def get_game_diff(self, game_id: str, full: bool = False) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Record a new room broadcast for a game and return (seq, state).
+        
+        state holds only the top-level fields changed since the previous broadcast,
+        or everything for the first broadcast or when full is True.
+        """
+        if game_id not in self.games:
+            return None
+        
+        state = self._get_cached_state(self.games[game_id])
+        last_state = self.last_broadcast_states.get(game_id)
+        self.last_broadcast_states[game_id] = state
+        seq = self.broadcast_seqs.get(game_id, 0) + 1
+        self.broadcast_seqs[game_id] = seq
+        
+        if full or last_state is None:
+            return seq, state
+        return seq, {key: value for key, value in state.items() if last_state.get(key) != value}
+    
+    def get_last_broadcast(self, game_id: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Get (seq, state) of the latest room broadcast, for a client resyncing before delta seq + 1"""
+        if game_id not in self.games:
+            return None
+        
+        state = self.last_broadcast_states.get(game_id)
+        if state is None:
+            # Nothing broadcast yet; the first delta carries the full state anyway
+            return 0, self._get_cached_state(self.games[game_id])
+        return self.broadcast_seqs[game_id], state
     
     def get_player_game(self, socket_id: str) -> Optional[str]:
         """Get the game ID that a player is currently in"""
@@ -135,23 +201,20 @@ class GameManager:
         
         # Start the game
         result = game.start_game()
+        game.state_version += 1
         if result["success"]:
+            self._lobby_cache = None
             start_type = "auto-started" if socket_id is None else "started by host"
-            logging.info(f"Game {game_id} {start_type} with {len(game.players)} players")
+            logging.info("Game %s %s with %d players", game_id, start_type, len(game.players))
         
         return result
     
     def handle_player_action(self, socket_id: str, action_type: str, action_data: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a player action"""
-        if socket_id not in self.player_to_game:
+        game = self.player_games.get(socket_id)
+        if game is None:
             return {"success": False, "reason": "Player not in any game"}
         
-        game_id = self.player_to_game[socket_id]
-        if game_id not in self.games:
-            return {"success": False, "reason": "Game not found"}
-        
-        game = self.games[game_id]
-        
         # Handle pawn placement directly in Game class during placement phase
         if action_type == "place_pawn":
             result = game.place_player_pawn(socket_id, action_data)
@@ -159,25 +222,36 @@ class GameManager:
             # Execute normal actions through actions.py
             result = execute_action(game, socket_id, action_type, action_data)
         
-        if result.get("success"):
-            logging.info(f"Player action in game {game_id}: {action_type} by {socket_id}")
+        # Even failed actions may have touched state, so always invalidate the cached snapshot
+        game.state_version += 1
         
+        # Fires on every action, so skip the call entirely when INFO is off
+        if result.get("success") and logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("Player action in game %s: %s by %s", game.game_id, action_type, socket_id)
+        
+        # Callers broadcast to the game's room, so hand back the id resolved above
+        result["game_id"] = game.game_id
         return result
     
     def get_valid_actions(self, socket_id: str) -> List[str]:
-        """Get valid actions for a player"""
-        if socket_id not in self.player_to_game:
+        """Get valid actions for a player (recomputed only after the game's state_version changes)"""
+        game = self.player_games.get(socket_id)
+        if game is None:
             return []
         
-        game_id = self.player_to_game[socket_id]
-        if game_id not in self.games:
-            return []
+        cached = self._valid_actions_cache.get(socket_id)
+        if cached is not None and cached[0] == game.state_version:
+            return cached[1]
         
-        game = self.games[game_id]
-        return game.get_valid_actions(socket_id)
+        actions = game.get_valid_actions(socket_id)
+        self._valid_actions_cache[socket_id] = (game.state_version, actions)
+        return actions
     
     def get_game_list(self) -> Dict[str, Any]:
-        """Get list of available games for lobby"""
+        """Get list of available games for lobby (cached until a game's players or state change)"""
+        if self._lobby_cache is not None:
+            return self._lobby_cache
+        
         games_info = {}
         for game_id, game in self.games.items():
             if game.state == GameState.WAITING:
@@ -189,6 +263,8 @@ class GameManager:
                     'player_names': [p.name for p in game.players.values()],
                     'host': game.players[game.host_socket_id].name if game.host_socket_id else None
                 }
+        
+        self._lobby_cache = games_info
         return games_info
     
     def get_game(self, game_id: str) -> Optional[Game]:
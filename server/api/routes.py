@@ -4,56 +4,89 @@ Handles client connections, game creation, player actions, and API endpoints.
 """
 
 from flask_socketio import emit, join_room, leave_room, disconnect
-from flask import request, jsonify
+from flask import request, Response
 from flask_cors import cross_origin
+import functools
+import json
 import logging
-import re
+import string
+import sys
 import time
 from .game_manager import GameManager
 
+log = logging.getLogger(__name__)
+
 # Initialize game manager (will be set up with socketio in register_socket_handlers)
 game_manager = GameManager()
 
+# Translation tables that delete every allowed character; anything left over is invalid
+_PLAYER_NAME_STRIP = str.maketrans('', '', string.ascii_letters + string.digits + '_-')
+_GAME_ID_STRIP = str.maketrans('', '', string.ascii_uppercase + string.digits)
+
+# Raw inputs longer than this are validated without being cached, so the caches stay small
+_MAX_CACHED_INPUT = 64
+
 # Input validation functions
-def validate_player_name(name):
-    """Validate player name input"""
-    if not name or not isinstance(name, str):
-        return False, "Player name is required"
-    
+@functools.lru_cache(maxsize=4096)
+def _check_player_name(name):
+    """Validate a player name string (memoized on the raw input)"""
     name = name.strip()
     if len(name) < 2:
         return False, "Player name must be at least 2 characters"
     if len(name) > 20:
         return False, "Player name must be 20 characters or less"
-    if not re.match(r'^[a-zA-Z0-9\s_-]+$', name):
+    leftover = name.translate(_PLAYER_NAME_STRIP)
+    if leftover and not leftover.isspace():
         return False, "Player name can only contain letters, numbers, spaces, hyphens, and underscores"
     
-    return True, name
+    # Interned so the many dict/room lookups keyed on it can short-circuit on identity
+    return True, sys.intern(name)
+
+def validate_player_name(name):
+    """Validate player name input"""
+    if not name or not isinstance(name, str):
+        return False, "Player name is required"
+    
+    if len(name) > _MAX_CACHED_INPUT:
+        return _check_player_name.__wrapped__(name)
+    return _check_player_name(name)
+
+@functools.lru_cache(maxsize=4096)
+def _check_game_id(game_id):
+    """Validate a game ID string (memoized on the raw input)"""
+    # IDs sent exactly as issued (the common case) skip the strip/upper copies
+    if len(game_id) != 6 or game_id.translate(_GAME_ID_STRIP):
+        game_id = game_id.strip().upper()
+        if len(game_id) != 6:
+            return False, "Game ID must be exactly 6 characters"
+        if game_id.translate(_GAME_ID_STRIP):
+            return False, "Game ID can only contain uppercase letters and numbers"
+    
+    return True, sys.intern(game_id)
 
 def validate_game_id(game_id):
     """Validate game ID format"""
     if not game_id or not isinstance(game_id, str):
         return False, "Game ID is required"
     
-    game_id = game_id.strip().upper()
-    if len(game_id) != 6:
-        return False, "Game ID must be exactly 6 characters"
-    if not re.match(r'^[A-Z0-9]+$', game_id):
-        return False, "Game ID can only contain uppercase letters and numbers"
-    
-    return True, game_id
+    if len(game_id) > _MAX_CACHED_INPUT:
+        return _check_game_id.__wrapped__(game_id)
+    return _check_game_id(game_id)
 
-def emit_error(message, error_code=None):
-    """Emit standardized error response"""
+def _error_payload(message, error_code=None):
+    """Build the standardized error response"""
     error_data = {
         'message': message,
         'timestamp': time.time()
     }
     if error_code:
         error_data['code'] = error_code
-    
-    logging.error(f"Socket error ({request.sid}): {message}")
-    emit('error', error_data)
+    return error_data
+
+def emit_error(message, error_code=None):
+    """Log and emit standardized error response"""
+    log.error("Socket error (%s): %s", request.sid, message)
+    emit('error', _error_payload(message, error_code))
 
 def register_socket_handlers(socketio):
     """Register all SocketIO event handlers"""
@@ -61,292 +94,271 @@ def register_socket_handlers(socketio):
     # Set up the socketio instance on the game manager
     game_manager.socketio = socketio
     
+    def socket_handler(event, failure_message, error_code="SERVER_ERROR"):
+        """Register a handler for event that reports any exception to the client as an error"""
+        def decorator(handler):
+            @socketio.on(event)
+            @functools.wraps(handler)
+            def wrapper(*args, **kwargs):
+                try:
+                    return handler(*args, **kwargs)
+                except Exception as e:
+                    # Logged once here, with the traceback, rather than again by emit_error
+                    log.exception("Error handling %s for %s", event, request.sid)
+                    emit('error', _error_payload(f"{failure_message}: {str(e)}", error_code))
+            return wrapper
+        return decorator
+    
     @socketio.on('connect')
     def handle_connect():
         """Handle client connection"""
-        print(f"Client connected: {request.sid}")
+        log.debug("Client connected: %s", request.sid)
         emit('connected', {'message': 'Connected to NMB Game server'})
     
-    @socketio.on('get_valid_actions')
+    @socket_handler('get_valid_actions', "Failed to get valid actions")
     def handle_get_valid_actions(data):
         """Handle request for valid actions"""
-        try:
-            valid_actions = game_manager.get_valid_actions(request.sid)
-            emit('valid_actions', {'actions': valid_actions})
-            
-        except Exception as e:
-            print(f"Error getting valid actions: {e}")
-            emit('error', {'message': f'Failed to get valid actions: {str(e)}'})
+        valid_actions = game_manager.get_valid_actions(request.sid)
+        emit('valid_actions', {'actions': valid_actions})
     
     @socketio.on('disconnect')
     def handle_disconnect():
         """Handle client disconnection"""
-        print(f"Client disconnected: {request.sid}")
+        log.debug("Client disconnected: %s", request.sid)
         
         # Remove player from their game
-        game_id = game_manager.leave_game(request.sid)
+        game_id, remaining = game_manager.leave_game(request.sid)
         if game_id:
-            # Notify other players in the game
+            log.debug("Player %s removed from game %s", request.sid, game_id)
+        
+        # Notify other players in the game; an emptied game was already deleted by leave_game
+        if remaining:
             socketio.emit('player_disconnected', {
                 'message': 'A player has disconnected',
                 'game_id': game_id
-            }, room=game_id)
-            
-            print(f"Player {request.sid} removed from game {game_id}")
-        
-    @socketio.on('create_game')
+            }, room=game_id, skip_sid=request.sid)
+    
+    @socket_handler('create_game', "Server error while creating game")
     def handle_create_game(data):
         """Handle game creation request"""
-        try:
-            # Validate input data
-            if not data or not isinstance(data, dict):
-                emit_error("Invalid request data", "INVALID_DATA")
-                return
-            
-            player_name = data.get('player_name')
-            
-            # Validate player name
-            is_valid, validated_name = validate_player_name(player_name)
-            if not is_valid:
-                emit_error(validated_name, "INVALID_PLAYER_NAME")
-                return
-            
-            print(f"Creating game for player: {validated_name}")
-            
-            # Create new game
-            game_id = game_manager.create_game(validated_name, request.sid)
-            
-            if not game_id:
-                emit_error("Failed to create game. Server may be at capacity.", "GAME_CREATION_FAILED")
-                return
-            
-            # Join the game room
-            join_room(game_id)
-            
-            # Send response to client
-            emit('game_created', {
-                'game_id': game_id,
-                'player_name': validated_name,
-                'message': f'Game {game_id} created successfully',
-                'auto_start_enabled': game_manager.get_auto_start_config(),
-                'success': True
-            })
-            
-            print(f"Game {game_id} created for player {validated_name}")
-            
-        except Exception as e:
-            print(f"Error creating game: {e}")
-            emit_error(f"Server error while creating game: {str(e)}", "SERVER_ERROR")
+        # Validate input data
+        if not data or not isinstance(data, dict):
+            emit_error("Invalid request data", "INVALID_DATA")
+            return
+        
+        player_name = data.get('player_name')
+        
+        # Validate player name
+        is_valid, validated_name = validate_player_name(player_name)
+        if not is_valid:
+            emit_error(validated_name, "INVALID_PLAYER_NAME")
+            return
+        
+        log.debug("Creating game for player: %s", validated_name)
+        
+        # Create new game
+        game_id = game_manager.create_game(validated_name, request.sid)
+        
+        if not game_id:
+            emit_error("Failed to create game. Server may be at capacity.", "GAME_CREATION_FAILED")
+            return
+        
+        # Join the game room
+        join_room(game_id)
+        
+        # Send response to client
+        emit('game_created', {
+            'game_id': game_id,
+            'player_name': validated_name,
+            'message': f'Game {game_id} created successfully',
+            'auto_start_enabled': game_manager.get_auto_start_config(),
+            'success': True
+        })
+        
+        log.debug("Game %s created for player %s", game_id, validated_name)
     
-    @socketio.on('join_game')
+    @socket_handler('join_game', "Server error while joining game")
     def handle_join_game(data):
         """Handle join game request"""
-        try:
-            # Validate input data
-            if not data or not isinstance(data, dict):
-                emit_error("Invalid request data", "INVALID_DATA")
-                return
-            
-            game_id = data.get('game_id')
-            player_name = data.get('player_name')
-            
-            # Validate game ID
-            is_valid_id, validated_game_id = validate_game_id(game_id)
-            if not is_valid_id:
-                emit_error(validated_game_id, "INVALID_GAME_ID")
-                return
+        # Validate input data
+        if not data or not isinstance(data, dict):
+            emit_error("Invalid request data", "INVALID_DATA")
+            return
+        
+        game_id = data.get('game_id')
+        player_name = data.get('player_name')
+        
+        # Validate game ID
+        is_valid_id, validated_game_id = validate_game_id(game_id)
+        if not is_valid_id:
+            emit_error(validated_game_id, "INVALID_GAME_ID")
+            return
+        
+        # Validate player name
+        is_valid_name, validated_name = validate_player_name(player_name)
+        if not is_valid_name:
+            emit_error(validated_name, "INVALID_PLAYER_NAME")
+            return
+        
+        log.debug("Player %s attempting to join game %s", validated_name, validated_game_id)
+        
+        # Check if game exists
+        if not game_manager.game_exists(validated_game_id):
+            emit_error(f"Game {validated_game_id} does not exist", "GAME_NOT_FOUND")
+            return
+        
+        # Join the game
+        result = game_manager.join_game(validated_game_id, validated_name, request.sid)
+        
+        if result["success"]:
+            # Join the game room
+            join_room(validated_game_id)
             
-            # Validate player name
-            is_valid_name, validated_name = validate_player_name(player_name)
-            if not is_valid_name:
-                emit_error(validated_name, "INVALID_PLAYER_NAME")
-                return
+            # Fields shared by the room broadcast and the joining player's ack
+            base = {
+                'game_id': validated_game_id,
+                'player_name': validated_name,
+                'player_count': result["player_count"],
+                'max_players': result["max_players"],
+                'auto_start_enabled': result.get("auto_start_enabled", False)
+            }
             
-            print(f"Player {validated_name} attempting to join game {validated_game_id}")
+            # Notify the other players in the game; the joiner gets the game_joined ack instead
+            socketio.emit('player_joined', {
+                **base,
+                'message': f'{validated_name} joined the game ({result["player_count"]}/{result["max_players"]} players)'
+            }, room=validated_game_id, skip_sid=request.sid)
             
-            # Check if game exists
-            if not game_manager.game_exists(validated_game_id):
-                emit_error(f"Game {validated_game_id} does not exist", "GAME_NOT_FOUND")
-                return
+            # Send success response to joining player
+            emit('game_joined', {**base, 'message': 'Successfully joined the game', 'success': True})
             
-            # Join the game
-            result = game_manager.join_game(validated_game_id, validated_name, request.sid)
+            log.debug("Player %s joined game %s (%d/%d players)", validated_name, validated_game_id,
+                      result["player_count"], result["max_players"])
             
-            if result["success"]:
-                # Join the game room
-                join_room(validated_game_id)
-                
-                # Notify all players in the game
-                socketio.emit('player_joined', {
-                    'player_name': validated_name,
-                    'player_count': result["player_count"],
-                    'max_players': result["max_players"],
-                    'auto_start_enabled': result.get("auto_start_enabled", False),
-                    'message': f'{validated_name} joined the game ({result["player_count"]}/{result["max_players"]} players)'
-                }, room=validated_game_id)
-                
-                # Send success response to joining player
-                emit('game_joined', {
-                    'game_id': validated_game_id,
-                    'player_name': validated_name,
-                    'player_count': result["player_count"],
-                    'max_players': result["max_players"],
-                    'auto_start_enabled': result.get("auto_start_enabled", False),
-                    'message': 'Successfully joined the game',
-                    'success': True
-                })
-                
-                print(f"Player {validated_name} joined game {validated_game_id} ({result['player_count']}/{result['max_players']} players)")
+            # Auto-start if conditions are met
+            if result.get("should_auto_start", False):
+                log.debug("Auto-starting game %s with %d players", validated_game_id, result["player_count"])
+                start_result = game_manager.start_game(validated_game_id, None)  # Auto-start doesn't require host permission
                 
-                # Auto-start if conditions are met
-                if result.get("should_auto_start", False):
-                    print(f"Auto-starting game {validated_game_id} with {result['player_count']} players")
-                    start_result = game_manager.start_game(validated_game_id, None)  # Auto-start doesn't require host permission
-                    
-                    if start_result["success"]:
-                        # Notify all players in the game that it started
-                        game_state = game_manager.get_game_state(validated_game_id)
-                        socketio.emit('game_started', {
-                            'game_id': validated_game_id,
-                            'message': 'Game auto-started with enough players!',
-                            'game_state': game_state,
-                            'auto_started': True
-                        }, room=validated_game_id)
-                
-            else:
-                emit_error(result.get("reason", "Failed to join game"), "JOIN_FAILED")
-                
-        except Exception as e:
-            print(f"Error joining game: {e}")
-            emit_error(f"Server error while joining game: {str(e)}", "SERVER_ERROR")
+                if start_result["success"]:
+                    # Notify all players in the game that it started
+                    seq, game_state = game_manager.get_game_diff(validated_game_id, full=True)
+                    socketio.emit('game_started', {
+                        'game_id': validated_game_id,
+                        'message': 'Game auto-started with enough players!',
+                        'game_state': game_state,
+                        'seq': seq,
+                        'auto_started': True
+                    }, room=validated_game_id)
+        else:
+            emit_error(result.get("reason", "Failed to join game"), "JOIN_FAILED")
     
-    @socketio.on('start_game')
+    @socket_handler('start_game', "Failed to start game")
     def handle_start_game(data):
         """Handle game start request"""
-        try:
-            game_id = data.get('game_id')
-            
-            print(f"Start game request for game {game_id} from {request.sid}")
-            
-            # Start the game
-            result = game_manager.start_game(game_id, request.sid)
+        game_id = data.get('game_id')
+        
+        log.debug("Start game request for game %s from %s", game_id, request.sid)
+        
+        # Start the game
+        result = game_manager.start_game(game_id, request.sid)
+        
+        if result["success"]:
+            # Notify all players in the game that it started
+            seq, game_state = game_manager.get_game_diff(game_id, full=True)
+            socketio.emit('game_started', {
+                'game_id': game_id,
+                'message': 'Game started!',
+                'game_state': game_state,
+                'seq': seq
+            }, room=game_id)
             
-            if result["success"]:
-                # Notify all players in the game that it started
-                game_state = game_manager.get_game_state(game_id)
-                socketio.emit('game_started', {
-                    'game_id': game_id,
-                    'message': 'Game started!',
-                    'game_state': game_state
-                }, room=game_id)
-                
-                print(f"Game {game_id} started successfully")
-            else:
-                emit('error', {'message': result.get("reason", "Failed to start game")})
-                
-        except Exception as e:
-            print(f"Error starting game: {e}")
-            emit('error', {'message': f'Failed to start game: {str(e)}'})
+            log.debug("Game %s started successfully", game_id)
+        else:
+            emit('error', {'message': result.get("reason", "Failed to start game")})
     
-    @socketio.on('player_action')
+    @socket_handler('player_action', "Failed to process action")
     def handle_player_action(data):
         """Handle player game actions"""
-        try:
-            action_type = data.get('action_type')
-            action_data = data.get('action_data', {})
-            
-            print(f"Player action received: {action_type} from {request.sid}")
+        action_type = data.get('action_type')
+        action_data = data.get('action_data', {})
+        
+        log.debug("Player action received: %s from %s", action_type, request.sid)
+        
+        # Process the action through GameManager
+        result = game_manager.handle_player_action(request.sid, action_type, action_data)
+        
+        if result["success"]:
+            game_id = result["game_id"]
+            # Only the fields changed by this action are broadcast, tagged with a sequence number
+            seq, changed = game_manager.get_game_diff(game_id)
             
-            # Process the action through GameManager
-            result = game_manager.handle_player_action(request.sid, action_type, action_data)
+            # Broadcast the delta to all players; it doubles as the actor's ack
+            socketio.emit('game_state_delta', {
+                'game_id': game_id,
+                'action_result': result,
+                'actor': request.sid,
+                'seq': seq,
+                'changed': changed
+            }, room=game_id)
             
-            if result["success"]:
-                # Get updated game state
-                game_id = game_manager.get_player_game(request.sid)
-                if game_id:
-                    game_state = game_manager.get_game_state(game_id)
-                    
-                    # Broadcast updated game state to all players
-                    socketio.emit('game_state_update', {
-                        'game_id': game_id,
-                        'action_result': result,
-                        'game_state': game_state
-                    }, room=game_id)
-                    
-                    print(f"Action {action_type} processed successfully for {request.sid}")
-                
-                # Send success response to acting player
-                emit('action_result', result)
-            else:
-                emit('error', {'message': result.get("reason", "Action failed")})
-                
-        except Exception as e:
-            print(f"Error processing player action: {e}")
-            emit('error', {'message': f'Failed to process action: {str(e)}'})
+            log.debug("Action %s processed successfully for %s", action_type, request.sid)
+        else:
+            emit('error', {'message': result.get("reason", "Action failed")})
     
-    @socketio.on('get_game_state')
+    @socket_handler('get_game_state', "Failed to get game state")
     def handle_get_game_state(data):
-        """Handle request for current game state"""
-        try:
-            game_id = data.get('game_id')
-            
-            # Get game state from manager
-            game_state = game_manager.get_game_state(game_id)
-            
-            if game_state:
-                emit('game_state_update', game_state)
-            else:
-                emit('error', {'message': 'Game not found'})
-                
-        except Exception as e:
-            print(f"Error getting game state: {e}")
-            emit('error', {'message': f'Failed to get game state: {str(e)}'})
+        """Handle request for current game state (clients resync here after missing a delta)"""
+        game_id = data.get('game_id')
+        
+        # The latest broadcast snapshot, so the client can continue with the next delta
+        snapshot = game_manager.get_last_broadcast(game_id)
+        
+        if snapshot:
+            seq, game_state = snapshot
+            emit('game_state_update', {'game_id': game_id, 'game_state': game_state, 'seq': seq})
+        else:
+            emit('error', {'message': 'Game not found'})
     
     print("[OK] SocketIO event handlers registered successfully")
 
 def register_http_routes(app):
     """Register HTTP API routes"""
+    from game_logic.constants import BOARD_SIZE, INITIAL_POSITION, FLOOR_COUNT, FLOOR_RANGE
+    
+    # The config is derived from constants, so serialize it once at registration
+    config = {
+        'board': {
+            'size': BOARD_SIZE,
+            'initial_position': INITIAL_POSITION,
+            'grid_size': BOARD_SIZE[0] * 4,  # Total sub-positions (tiles * 4)
+            'tile_size': 4  # Each tile is 4x4 sub-positions
+        },
+        'floors': {
+            'count': FLOOR_COUNT,
+            'range': FLOOR_RANGE,
+            'starting_floor': 2
+        }
+    }
+    config_bytes = json.dumps(config, separators=(',', ':')).encode()
+    
+    # Explicit CORS headers
+    cors_headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET, OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization, Accept'
+    }
+    config_headers = {**cors_headers, 'Content-Type': 'application/json'}
     
     @app.route('/api/config')
     def get_config():
         """Get game configuration including board dimensions"""
-        from game_logic.constants import BOARD_SIZE, INITIAL_POSITION, FLOOR_COUNT, FLOOR_RANGE
-        from flask import make_response
-        
-        config = {
-            'board': {
-                'size': BOARD_SIZE,
-                'initial_position': INITIAL_POSITION,
-                'grid_size': BOARD_SIZE[0] * 4,  # Total sub-positions (tiles * 4)
-                'tile_size': 4  # Each tile is 4x4 sub-positions
-            },
-            'floors': {
-                'count': FLOOR_COUNT,
-                'range': FLOOR_RANGE,
-                'starting_floor': 2
-            }
-        }
-        
-        # Create response with explicit CORS headers
-        response = make_response(jsonify(config))
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
-        
-        print(f"[API] Config endpoint called, sending: {config}")
-        return response
+        return Response(config_bytes, headers=config_headers)
     
     @app.route('/api/config', methods=['OPTIONS'])
     def config_options():
         """Handle preflight OPTIONS request for /api/config"""
-        from flask import make_response
-        
-        response = make_response()
-        response.headers['Access-Control-Allow-Origin'] = '*'
-        response.headers['Access-Control-Allow-Methods'] = 'GET, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, Accept'
-        
-        print("[API] Config OPTIONS preflight handled")
-        return response
+        log.debug("Config OPTIONS preflight handled")
+        return Response(headers=cors_headers)
     
     print("[OK] HTTP routes registered successfully")
\ No newline at end of file
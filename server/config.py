@@ -16,7 +16,7 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'nmb-game-dev-secret-key-change-in-production'
     
     # SocketIO settings
-    SOCKETIO_ASYNC_MODE = 'threading'
+    SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')  # threading, eventlet or gevent
     
     # Game settings
     MAX_PLAYERS_PER_GAME = int(os.environ.get('MAX_PLAYERS_PER_GAME', 4))
@@ -33,6 +33,9 @@ class Config:
     # Development settings
     DEBUG = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
     
+    # Logging settings (per-event handler logs are emitted at DEBUG)
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    
 class DevelopmentConfig(Config):
     """Development configuration"""
     DEBUG = True
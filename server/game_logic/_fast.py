@@ -0,0 +1,82 @@
+"""
+Numeric kernels for NMB Game hot paths.
+Compiled with Numba when it is installed; otherwise they run as plain Python.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Optional dependency - fall back to the interpreter
+    np = None
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Cell values used in the dense tile grid (one cell per tile position)
+CELL_EMPTY = 0
+CELL_TILE = 1
+CELL_CORRUPTED = 2
+
+def new_grid(size: int):
+    """Allocate a zeroed flat int32 grid (a plain list without NumPy)"""
+    if HAVE_NUMBA:
+        return np.zeros(size, dtype=np.int32)
+    return [CELL_EMPTY] * size
+
+# =============================================================================
+# CORRUPTION
+# =============================================================================
+
+@njit(cache=True)
+def mark_corruption_candidates(tiles, out, floors, height, width):
+    """Flag healthy tiles touching a corrupted tile (8-neighbourhood, same floor).
+
+    Both grids are flat arrays indexed as ((floor * height) + y) * width + x.
+    Returns the number of flagged cells.
+    """
+    count = 0
+    for f in range(floors):
+        base = f * height * width
+        for y in range(height):
+            for x in range(width):
+                idx = base + y * width + x
+                out[idx] = 0
+                if tiles[idx] != CELL_TILE:
+                    continue
+                for dy in range(-1, 2):
+                    ny = y + dy
+                    if ny < 0 or ny >= height:
+                        continue
+                    for dx in range(-1, 2):
+                        nx = x + dx
+                        if (dx == 0 and dy == 0) or nx < 0 or nx >= width:
+                            continue
+                        if tiles[base + ny * width + nx] == CELL_CORRUPTED:
+                            out[idx] = 1
+                    if out[idx]:
+                        break
+                count += out[idx]
+    return count
+
+# =============================================================================
+# WARM-UP
+# =============================================================================
+
+def warmup() -> bool:
+    """Compile (or load from cache) every kernel before the first client connects.
+
+    Returns True if the kernels were JIT compiled, False when running as plain Python.
+    """
+    if not HAVE_NUMBA:
+        return False
+    
+    tiles = new_grid(2 * 2 * 2)
+    tiles[0] = CELL_CORRUPTED
+    tiles[1] = CELL_TILE
+    mark_corruption_candidates(tiles, new_grid(tiles.size), 2, 2, 2)
+    return True
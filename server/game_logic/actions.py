@@ -6,12 +6,41 @@ Implements all player actions: Explore, Fall, Move, Meet, Rob, use stairs/elevat
 from typing import Dict, List, Optional, Tuple, Any
 import random
 import logging
-from datetime import datetime
+import time
 
 from .constants import *
 from .player import Player
-from .board import Board, Position, TilePosition, PathTile
-from .cards import *
+from .board import Position, TilePosition, PathTile
+from .cards import EventCard, ItemCard
+from .game import GameState
+
+logger = logging.getLogger(__name__)
+
+# Action type strings checked by validate_action (resolved once instead of via Enum.value per call)
+_ACTION_MOVE = ActionType.MOVE.value
+_ACTION_EXPLORE = ActionType.EXPLORE.value
+_ACTION_FALL = ActionType.FALL.value
+
+# Board bounds in tiles, and the valid floors (built once rather than per stairwell use)
+_BOARD_W, _BOARD_H = BOARD_SIZE
+_FLOORS = range(*FLOOR_RANGE)
+
+# Phases in which elevators can malfunction. A tuple, not a frozenset: membership
+# short-circuits on identity, while hashing a GamePhase runs Enum's Python __hash__
+_MALFUNCTION_PHASES = (GamePhase.MUTATION, GamePhase.END_GAME)
+
+# Bound methods of the shared generator, so random.seed() still applies
+_rand = random.random
+_rrange = random.randrange
+_rchoice = random.choice
+
+# Explore auto-placement directions: (dx, dy, name, required sub_x, required sub_y)
+_EXPLORE_DIRECTIONS = (
+    (1, 0, "East", 3, None),    # East: must be on right edge (sub_x == 3)
+    (-1, 0, "West", 0, None),   # West: must be on left edge (sub_x == 0)
+    (0, 1, "South", None, 3),   # South: must be on bottom edge (sub_y == 3)
+    (0, -1, "North", None, 0)   # North: must be on top edge (sub_y == 0)
+)
 
 def _can_place_tile_from_position(player_sub_x: int, player_sub_y: int, 
                                   current_tile_pos: 'TilePosition', 
@@ -60,7 +89,7 @@ def validate_action(game, socket_id: str, action_type: str) -> Tuple[bool, str]:
     if socket_id not in game.players:
         return False, "Player not found"
     
-    if game.state.value != "playing":
+    if game.state is not GameState.PLAYING:
         return False, "Game is not in playing state"
     
     if not game.is_player_turn(socket_id):
@@ -69,19 +98,19 @@ def validate_action(game, socket_id: str, action_type: str) -> Tuple[bool, str]:
     player = game.players[socket_id]
     
     # Check action-specific requirements
-    if action_type == ActionType.EXPLORE.value:
-        if not can_explore(player.disorder):
+    if action_type == _ACTION_EXPLORE:
+        if not player._can_explore:
             return False, f"Disorder too high ({player.disorder} >= {DISORDER_FALL_THRESHOLD}), must Fall"
         if player.get_remaining_movement() <= 0:
             return False, "No movement points remaining"
     
-    elif action_type == ActionType.FALL.value:
-        if can_explore(player.disorder):
+    elif action_type == _ACTION_FALL:
+        if player._can_explore:
             return False, f"Disorder too low ({player.disorder} < {DISORDER_FALL_THRESHOLD}), can Explore"
         if player.floor <= 1:
             return False, "Already on bottom floor"
     
-    elif action_type == ActionType.MOVE.value:
+    elif action_type == _ACTION_MOVE:
         if player.get_remaining_movement() <= 0:
             return False, "No movement points remaining"
     
@@ -93,7 +122,7 @@ def validate_action(game, socket_id: str, action_type: str) -> Tuple[bool, str]:
 
 def action_move(game, socket_id: str, move_data: Dict[str, Any]) -> Dict[str, Any]:
     """Handle player movement action"""
-    is_valid, reason = validate_action(game, socket_id, ActionType.MOVE.value)
+    is_valid, reason = validate_action(game, socket_id, _ACTION_MOVE)
     if not is_valid:
         return {"success": False, "reason": reason}
     
@@ -117,12 +146,8 @@ def action_move(game, socket_id: str, move_data: Dict[str, Any]) -> Dict[str, An
             )
         else:
             # Legacy format - convert absolute coordinates to tile+sub
-            abs_x = target_position["x"]
-            abs_y = target_position["y"]
-            tile_x = abs_x // 4
-            tile_y = abs_y // 4
-            sub_x = abs_x % 4
-            sub_y = abs_y % 4
+            tile_x, sub_x = divmod(target_position["x"], 4)
+            tile_y, sub_y = divmod(target_position["y"], 4)
             target_pos = Position(tile_x, tile_y, sub_x, sub_y, target_position["floor"])
     except (ValueError, KeyError) as e:
         return {"success": False, "reason": f"Invalid target position: {str(e)}"}
@@ -134,10 +159,9 @@ def action_move(game, socket_id: str, move_data: Dict[str, Any]) -> Dict[str, An
     if not game.board.is_position_movable(target_pos):
         return {"success": False, "reason": "Target position is not movable (blocked by walls or obstacles)"}
     
-    # Calculate movement cost (simple distance for now)
-    abs_current = current_pos.to_absolute_coords()
-    abs_target = target_pos.to_absolute_coords()
-    movement_cost = abs(abs_target[0] - abs_current[0]) + abs(abs_target[1] - abs_current[1])
+    # Calculate movement cost (Manhattan distance in absolute sub-position units)
+    movement_cost = (abs((target_pos.tile_x - current_pos.tile_x) * 4 + target_pos.sub_x - current_pos.sub_x) +
+                     abs((target_pos.tile_y - current_pos.tile_y) * 4 + target_pos.sub_y - current_pos.sub_y))
     
     # For now, use simple movement cost calculation
     # Later we can implement proper pathfinding with the new position system
@@ -145,8 +169,9 @@ def action_move(game, socket_id: str, move_data: Dict[str, Any]) -> Dict[str, An
         return {"success": False, "reason": "Already at target position"}
     
     # Check movement points
-    if movement_cost > player.get_remaining_movement():
-        return {"success": False, "reason": f"Not enough movement points ({movement_cost} needed, {player.get_remaining_movement()} available)"}
+    remaining = player.get_remaining_movement()
+    if movement_cost > remaining:
+        return {"success": False, "reason": f"Not enough movement points ({movement_cost} needed, {remaining} available)"}
     
     # Perform movement
     player.use_movement_points(movement_cost)
@@ -158,7 +183,8 @@ def action_move(game, socket_id: str, move_data: Dict[str, Any]) -> Dict[str, An
     tile_effects = []
     if tile:
         player.current_tile_id = tile.tile_id
-        tile_effects = _handle_tile_effects(game, player, tile, "movement_end")
+        if tile._has_move_end_effect:
+            tile_effects = _handle_tile_effects(game, player, tile, "movement_end")
     
     game.total_actions += 1
     game._log_event("player_moved", f"{player.name} moved to {target_pos.to_tuple()} (cost: {movement_cost})", socket_id)
@@ -168,74 +194,53 @@ def action_move(game, socket_id: str, move_data: Dict[str, Any]) -> Dict[str, An
         "player": player.name,
         "new_position": target_pos.to_tuple(),
         "movement_cost": movement_cost,
-        "remaining_movement": player.get_remaining_movement(),
+        "remaining_movement": remaining - movement_cost,  # Tile effects never touch movement points
         "path": path,
         "tile_effects": tile_effects
     }
 
 def action_explore(game, socket_id: str, explore_data: Dict[str, Any]) -> Dict[str, Any]:
     """Handle explore action - draw and place new path tile"""
-    print(f"[DEBUG] Explore action called! socket_id: {socket_id}, data: {explore_data}")
+    logger.debug("Explore action called: %s %s", socket_id, explore_data)
     
-    is_valid, reason = validate_action(game, socket_id, ActionType.EXPLORE.value)
+    is_valid, reason = validate_action(game, socket_id, _ACTION_EXPLORE)
     if not is_valid:
-        print(f"[ERROR] Explore action validation failed: {reason}")
+        logger.debug("Explore action validation failed: %s", reason)
         return {"success": False, "reason": reason}
     
-    print("[OK] Explore action validation passed!")
-    
     player = game.players[socket_id]
     placement_position = explore_data.get("placement_position")
-    print(f"[DEBUG] Player: {player.name}, placement_position: {placement_position}")
+    logger.debug("Player: %s, placement_position: %s", player.name, placement_position)
     
     # If no placement position specified, automatically find valid position based on player's sub-position
     if not placement_position:
-        # Get player's current tile position and sub-position
-        current_tile_pos = TilePosition(
-            x=player.position.tile_x,
-            y=player.position.tile_y, 
-            floor=player.position.floor
-        )
-        player_sub_x = player.position.sub_x
-        player_sub_y = player.position.sub_y
-        
-        # Determine valid placement directions based on player's sub-position
-        valid_directions = []
+        # Test neighbours with raw (x, y) keys against the floor's tile dict; only the chosen spot becomes a TilePosition
+        pos = player.position
+        floor_tiles = game.board.floors[pos.floor]
+        place_pos = None
         
-        # Check each cardinal direction
-        directions = [
-            (1, 0, "East", 3, None),    # East: must be on right edge (sub_x == 3)
-            (-1, 0, "West", 0, None),   # West: must be on left edge (sub_x == 0)  
-            (0, 1, "South", None, 3),   # South: must be on bottom edge (sub_y == 3)
-            (0, -1, "North", None, 0)   # North: must be on top edge (sub_y == 0)
-        ]
-        
-        for dx, dy, name, req_sub_x, req_sub_y in directions:
+        for dx, dy, name, req_sub_x, req_sub_y in _EXPLORE_DIRECTIONS:
             # Check if player's sub-position allows this direction
-            can_place_direction = True
-            if req_sub_x is not None and player_sub_x != req_sub_x:
-                can_place_direction = False
-            if req_sub_y is not None and player_sub_y != req_sub_y:
-                can_place_direction = False
-                
-            if can_place_direction:
-                test_x = current_tile_pos.x + dx
-                test_y = current_tile_pos.y + dy
-                
-                # Check bounds
-                if 0 <= test_x < BOARD_SIZE[0] and 0 <= test_y < BOARD_SIZE[1]:
-                    test_pos = TilePosition(test_x, test_y, current_tile_pos.floor)
-                    
-                    # Check if position is not occupied
-                    if not game.board.get_tile_at_tile_pos(test_pos):
-                        valid_directions.append((test_pos, name))
+            if req_sub_x is not None and pos.sub_x != req_sub_x:
+                continue
+            if req_sub_y is not None and pos.sub_y != req_sub_y:
+                continue
+            
+            test_x = pos.tile_x + dx
+            test_y = pos.tile_y + dy
+            
+            # Check bounds and that the position is not occupied
+            if 0 <= test_x < _BOARD_W and 0 <= test_y < _BOARD_H and (test_x, test_y) not in floor_tiles:
+                # Use the first valid direction found
+                place_pos = TilePosition(test_x, test_y, pos.floor)
+                direction_name = name
+                break
         
-        if not valid_directions:
+        if place_pos is None:
             return {"success": False, "reason": "Cannot explore from your current position. Move to the outer edge of your tile in the direction you want to place a tile."}
         
-        # Use the first valid direction found
-        place_pos, direction_name = valid_directions[0]
-        print(f"[DEBUG] Auto-placement: Player at sub-pos ({player_sub_x},{player_sub_y}) can place tile {direction_name} at tile ({place_pos.x},{place_pos.y})")
+        logger.debug("Auto-placement: player at sub-pos (%d,%d) can place tile %s at tile (%d,%d)",
+                     pos.sub_x, pos.sub_y, direction_name, place_pos.x, place_pos.y)
     else:
         # Handle frontend that specifies placement_position
         try:
@@ -272,20 +277,23 @@ def action_explore(game, socket_id: str, explore_data: Dict[str, Any]) -> Dict[s
         )
         
         if not can_place:
-            print(f"[DEBUG] Manual placement validation failed: Player at sub-pos ({player.position.sub_x},{player.position.sub_y}) cannot place tile at ({place_pos.x},{place_pos.y}): {reason}")
+            logger.debug("Manual placement rejected: player at sub-pos (%d,%d) cannot place tile at (%d,%d): %s",
+                         player.position.sub_x, player.position.sub_y, place_pos.x, place_pos.y, reason)
             return {"success": False, "reason": reason}
         
-        print(f"[DEBUG] Manual placement validated: Player at sub-pos ({player.position.sub_x},{player.position.sub_y}) can place tile at ({place_pos.x},{place_pos.y})")
+        logger.debug("Manual placement validated: player at sub-pos (%d,%d) can place tile at (%d,%d)",
+                     player.position.sub_x, player.position.sub_y, place_pos.x, place_pos.y)
     
     # Draw path tile from deck (only after all position validation passes)
-    path_card = game.decks[CardType.PATH_TILE].draw()
+    path_deck = game.decks[CardType.PATH_TILE]
+    path_card = path_deck.draw()
     if not path_card:
         return {"success": False, "reason": "No path tiles remaining"}
     
     # Check if placement position is valid (adjacent to existing tiles)
     if not game.board._has_adjacent_tile(place_pos):
         # Return card to deck
-        game.decks[CardType.PATH_TILE].add_card(path_card)
+        path_deck.add_card(path_card)
         return {"success": False, "reason": "Tile must be placed adjacent to existing tiles"}
     
     # Create tile from card
@@ -299,12 +307,12 @@ def action_explore(game, socket_id: str, explore_data: Dict[str, Any]) -> Dict[s
     
     # Place tile on board
     if not game.board.place_tile(new_tile):
-        game.decks[CardType.PATH_TILE].add_card(path_card)
+        path_deck.add_card(path_card)
         return {"success": False, "reason": "Cannot place tile at this position"}
     
     # Handle disordered tiles
     disorder_increase = 0
-    if new_tile.tile_type == PathTileType.DISORDERED:
+    if new_tile.tile_type is PathTileType.DISORDERED:
         disorder_increase = 1
         player.update_disorder(disorder_increase, "placed disordered tile")
     
@@ -330,7 +338,7 @@ def action_explore(game, socket_id: str, explore_data: Dict[str, Any]) -> Dict[s
 
 def action_fall(game, socket_id: str, fall_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """Handle fall action - drop to floor below"""
-    is_valid, reason = validate_action(game, socket_id, ActionType.FALL.value)
+    is_valid, reason = validate_action(game, socket_id, _ACTION_FALL)
     if not is_valid:
         return {"success": False, "reason": reason}
     
@@ -342,10 +350,10 @@ def action_fall(game, socket_id: str, fall_data: Dict[str, Any] = None) -> Dict[
         return fall_result
     
     # Draw and place new path tile on the floor below
-    path_card = game.decks[CardType.PATH_TILE].draw()
+    path_deck = game.decks[CardType.PATH_TILE]
+    path_card = path_deck.draw()
     if path_card:
         # Place tile at player's position on new floor
-        from .board import TilePosition
         fall_pos = TilePosition(
             x=player.position.tile_x,
             y=player.position.tile_y, 
@@ -364,7 +372,7 @@ def action_fall(game, socket_id: str, fall_data: Dict[str, Any] = None) -> Dict[
             fall_result["tile_placed"] = new_tile.to_dict()
         else:
             # Return card to deck if can't place
-            game.decks[CardType.PATH_TILE].add_card(path_card)
+            path_deck.add_card(path_card)
     
     game.total_actions += 1
     game._log_event("player_fell", f"{player.name} fell to floor {player.floor}", socket_id)
@@ -420,19 +428,18 @@ def action_use_stairs(game, socket_id: str, stairs_data: Dict[str, Any]) -> Dict
     player = game.players[socket_id]
     target_floor = stairs_data.get("target_floor")
     
-    if target_floor not in range(*FLOOR_RANGE):
+    if target_floor not in _FLOORS:
         return {"success": False, "reason": "Invalid target floor"}
     
     # Check if player is on a stairwell tile
-    current_pos = Position(player.position[0], player.position[1], player.floor)
-    tile = game.board.get_tile(current_pos)
+    tile_x, tile_y = player.position.tile_x, player.position.tile_y
+    tile = game.board.get_tile_xyz(tile_x, tile_y, player.floor)
     
-    if not tile or tile.tile_type != PathTileType.STAIRWELL:
+    if not tile or tile.tile_type is not PathTileType.STAIRWELL:
         return {"success": False, "reason": "Must be on a stairwell tile"}
     
     # Check floor difference
-    floor_diff = abs(target_floor - player.floor)
-    if floor_diff != 1:
+    if target_floor - player.floor not in (-1, 1):
         return {"success": False, "reason": "Stairwells only allow movement to adjacent floors"}
     
     # Perform movement
@@ -440,20 +447,19 @@ def action_use_stairs(game, socket_id: str, stairs_data: Dict[str, Any]) -> Dict
     player.change_floor(target_floor, "used stairwell")
     
     # Remove stairwell tile after use
-    game.board.remove_tile(current_pos)
+    game.board.remove_tile(TilePosition(tile_x, tile_y, old_floor))
     
     # Find or create landing position on target floor
-    target_pos = Position(player.position[0], player.position[1], target_floor)
-    target_tile = game.board.get_tile(target_pos)
+    target_tile = game.board.get_tile_xyz(tile_x, tile_y, target_floor)
     
     if not target_tile:
         # Create basic tile at landing position
         path_card = game.decks[CardType.PATH_TILE].draw()
-        if path_card and path_card.tile_type == PathTileType.BASIC:
+        if path_card and path_card.tile_type is PathTileType.BASIC:
             landing_tile = PathTile(
                 tile_id=path_card.card_id,
                 tile_type=path_card.tile_type,
-                position=target_pos,
+                position=TilePosition(tile_x, tile_y, target_floor),
                 special_squares=path_card.layout
             )
             game.board.place_tile(landing_tile)
@@ -478,32 +484,31 @@ def action_use_elevator(game, socket_id: str, elevator_data: Dict[str, Any]) ->
     target_zone = elevator_data.get("target_zone")
     
     # Check if player is on an elevator tile
-    current_pos = Position(player.position[0], player.position[1], player.floor)
-    tile = game.board.get_tile(current_pos)
+    tile = game.board.get_tile_xyz(player.position.tile_x, player.position.tile_y, player.floor)
     
-    if not tile or tile.tile_type != PathTileType.ELEVATOR:
+    if not tile or tile.tile_type is not PathTileType.ELEVATOR:
         return {"success": False, "reason": "Must be on an elevator tile"}
     
     # Draw button card to determine available destinations
-    button_card = game.decks[CardType.BUTTON].draw()
+    button_deck = game.decks[CardType.BUTTON]
+    button_card = button_deck.draw()
     if not button_card:
         return {"success": False, "reason": "No elevator buttons available"}
     
     # Check if target floor/zone is accessible
     if target_floor and not button_card.can_access_floor(target_floor):
-        game.decks[CardType.BUTTON].discard(button_card)
+        button_deck.discard(button_card)
         return {"success": False, "reason": f"Elevator button doesn't access floor {target_floor}"}
     
     if target_zone and not button_card.can_access_zone(target_zone):
-        game.decks[CardType.BUTTON].discard(button_card)
+        button_deck.discard(button_card)
         return {"success": False, "reason": f"Elevator button doesn't access zone {target_zone}"}
     
     # Check for malfunction in mutation+ phases
-    if game.current_phase in [GamePhase.MUTATION, GamePhase.END_GAME]:
-        if random.random() < ELEVATOR_MALFUNCTION_CHANCE:
-            game.decks[CardType.BUTTON].discard(button_card)
-            game._log_event("elevator_malfunction", f"Elevator malfunctioned for {player.name}", socket_id)
-            return {"success": False, "reason": "Elevator malfunctioned!"}
+    if game.current_phase in _MALFUNCTION_PHASES and _rand() < ELEVATOR_MALFUNCTION_CHANCE:
+        button_deck.discard(button_card)
+        game._log_event("elevator_malfunction", f"Elevator malfunctioned for {player.name}", socket_id)
+        return {"success": False, "reason": "Elevator malfunctioned!"}
     
     # Perform elevator travel
     old_floor = player.floor
@@ -515,33 +520,33 @@ def action_use_elevator(game, socket_id: str, elevator_data: Dict[str, Any]) ->
     # If targeting specific zone, try to place player there
     if target_zone:
         # Find a position in the target zone or create one
-        zone_positions = [pos for pos, zone in game.board.zone_assignments.items() if zone == target_zone]
+        zone_positions = game.board.positions_by_zone.get(target_zone)
         
         if zone_positions:
             # Pick random position in zone
-            new_pos_2d = random.choice(zone_positions)
+            new_pos_2d = _rchoice(zone_positions)
             player.update_position(new_pos_2d)
         else:
             # Create new position in zone
-            x, y = random.randint(0, BOARD_SIZE[0]-1), random.randint(0, BOARD_SIZE[1]-1)
+            x, y = _rrange(_BOARD_W), _rrange(_BOARD_H)
             player.update_position((x, y))
-            game.board.zone_assignments[(x, y)] = target_zone
+            game.board.set_zone((x, y), target_zone)
     
     # Find or create elevator tile at destination
-    dest_pos = Position(player.position[0], player.position[1], player.floor)
-    dest_tile = game.board.get_tile(dest_pos)
+    dest_x, dest_y = player.position.tile_x, player.position.tile_y
+    dest_tile = game.board.get_tile_xyz(dest_x, dest_y, player.floor)
     
     if not dest_tile:
         # Create elevator tile at destination
         elevator_tile = PathTile(
-            tile_id=f"elevator_dest_{dest_pos.x}_{dest_pos.y}_{dest_pos.floor}",
+            tile_id=f"elevator_dest_{dest_x}_{dest_y}_{player.floor}",
             tile_type=PathTileType.ELEVATOR,
-            position=dest_pos
+            position=TilePosition(dest_x, dest_y, player.floor)
         )
         game.board.place_tile(elevator_tile)
         player.current_tile_id = elevator_tile.tile_id
     
-    game.decks[CardType.BUTTON].discard(button_card)
+    button_deck.discard(button_card)
     
     game._log_event("used_elevator", 
                     f"{player.name} used elevator from floor {old_floor} to floor {player.floor}" + 
@@ -559,6 +564,24 @@ def action_use_elevator(game, socket_id: str, elevator_data: Dict[str, Any]) ->
         "button_card": button_card.to_dict()
     }
 
+def _use_first_aid_kit(player: Player) -> List[Dict[str, Any]]:
+    player.update_disorder(-2, "used first aid kit")
+    return [{"type": "disorder_heal", "value": -2}]
+
+def _use_flashlight(player: Player) -> List[Dict[str, Any]]:
+    return [{"type": "vision_bonus", "duration": 3}]
+
+def _use_emergency_radio(player: Player) -> List[Dict[str, Any]]:
+    # Share information with all players
+    return [{"type": "share_info", "target": "all_players"}]
+
+# Item name -> effect handler (expand based on actual item types)
+ITEM_EFFECT_HANDLERS = {
+    "First Aid Kit": _use_first_aid_kit,
+    "Flashlight": _use_flashlight,
+    "Emergency Radio": _use_emergency_radio
+}
+
 def action_use_item(game, socket_id: str, item_data: Dict[str, Any]) -> Dict[str, Any]:
     """Handle item card usage"""
     player = game.players[socket_id]
@@ -573,18 +596,9 @@ def action_use_item(game, socket_id: str, item_data: Dict[str, Any]) -> Dict[str
         return {"success": False, "reason": "Item not found in inventory"}
     
     # Apply item effects (simplified - would need full effect system)
-    effect_results = []
     item_name = item.get("name", "Unknown Item")
-    
-    # Basic item effects (expand based on actual item types)
-    if "First Aid Kit" in item_name:
-        player.update_disorder(-2, "used first aid kit")
-        effect_results.append({"type": "disorder_heal", "value": -2})
-    elif "Flashlight" in item_name:
-        effect_results.append({"type": "vision_bonus", "duration": 3})
-    elif "Emergency Radio" in item_name:
-        # Share information with all players
-        effect_results.append({"type": "share_info", "target": "all_players"})
+    handler = ITEM_EFFECT_HANDLERS.get(item_name)
+    effect_results = handler(player) if handler else []
     
     game._log_event("used_item", f"{player.name} used {item_name}", socket_id)
     
@@ -619,62 +633,73 @@ def action_end_turn(game, socket_id: str, end_data: Dict[str, Any] = None) -> Di
 # UTILITY FUNCTIONS
 # =============================================================================
 
+def _handle_event_square(game, player: Player) -> List[Dict[str, Any]]:
+    """Draw and apply an event card"""
+    effect_deck = game.decks[CardType.EFFECT]
+    event_card = effect_deck.draw()
+    if not (event_card and isinstance(event_card, EventCard)):
+        return []
+    
+    # Apply event effects
+    event_result = event_card.apply_effects(player, game)
+    
+    # Discard event card after use
+    effect_deck.discard(event_card)
+    return [{
+        "type": "event_triggered",
+        "card": event_card.to_dict(),
+        "result": event_result
+    }]
+
+def _handle_item_square(game, player: Player) -> List[Dict[str, Any]]:
+    """Draw an item card into the player's inventory"""
+    effect_deck = game.decks[CardType.EFFECT]
+    item_card = effect_deck.draw()
+    if not (item_card and isinstance(item_card, ItemCard)):
+        return []
+    
+    if player.inventory.add_item(item_card.to_dict()):
+        player.stats['items_found'] += 1
+        return [{
+            "type": "item_found",
+            "card": item_card.to_dict()
+        }]
+    
+    # Return to deck if inventory full
+    effect_deck.add_card(item_card)
+    return [{
+        "type": "item_found_inventory_full",
+        "card": item_card.to_dict()
+    }]
+
+def _handle_emergency_door(game, player: Player) -> List[Dict[str, Any]]:
+    """Check if player has required escape items"""
+    if player.escape_items_collected >= ESCAPE_ITEMS_REQUIRED:
+        return [{
+            "type": "escape_available",
+            "message": "You can escape through this door!"
+        }]
+    return [{
+        "type": "escape_blocked",
+        "message": f"Need {ESCAPE_ITEMS_REQUIRED - player.escape_items_collected} more escape items"
+    }]
+
+# Square type -> movement-end effect handler
+SQUARE_EFFECT_HANDLERS = {
+    SpecialSquareType.EVENT_SQUARE: _handle_event_square,
+    SpecialSquareType.ITEM_SQUARE: _handle_item_square,
+    SpecialSquareType.EMERGENCY_DOOR: _handle_emergency_door
+}
+
 def _handle_tile_effects(game, player: Player, tile: PathTile, trigger: str) -> List[Dict[str, Any]]:
     """Handle special tile effects when triggered"""
-    effects = []
+    # Every square effect fires on movement end only
+    if trigger != "movement_end":
+        return []
     
     # Get player's local position on tile (simplified - assume center)
-    local_pos = (1, 1)  # Center of 4x4 tile
-    
-    square_type = tile.special_squares.get(local_pos, SpecialSquareType.NORMAL)
-    
-    if square_type == SpecialSquareType.EVENT_SQUARE and trigger == "movement_end":
-        # Draw event card
-        event_card = game.decks[CardType.EFFECT].draw()
-        if event_card and isinstance(event_card, EventCard):
-            # Apply event effects
-            event_result = event_card.apply_effects(player, game)
-            effects.append({
-                "type": "event_triggered",
-                "card": event_card.to_dict(),
-                "result": event_result
-            })
-            
-            # Discard event card after use
-            game.decks[CardType.EFFECT].discard(event_card)
-    
-    elif square_type == SpecialSquareType.ITEM_SQUARE and trigger == "movement_end":
-        # Draw item card
-        item_card = game.decks[CardType.EFFECT].draw()
-        if item_card and isinstance(item_card, ItemCard):
-            if player.inventory.add_item(item_card.to_dict()):
-                effects.append({
-                    "type": "item_found",
-                    "card": item_card.to_dict()
-                })
-                player.stats['items_found'] += 1
-            else:
-                # Return to deck if inventory full
-                game.decks[CardType.EFFECT].add_card(item_card)
-                effects.append({
-                    "type": "item_found_inventory_full",
-                    "card": item_card.to_dict()
-                })
-    
-    elif square_type == SpecialSquareType.EMERGENCY_DOOR and trigger == "movement_end":
-        # Check if player has required escape items
-        if player.escape_items_collected >= ESCAPE_ITEMS_REQUIRED:
-            effects.append({
-                "type": "escape_available",
-                "message": "You can escape through this door!"
-            })
-        else:
-            effects.append({
-                "type": "escape_blocked",
-                "message": f"Need {ESCAPE_ITEMS_REQUIRED - player.escape_items_collected} more escape items"
-            })
-    
-    return effects
+    handler = SQUARE_EFFECT_HANDLERS.get(tile._center_square_type)
+    return handler(game, player) if handler else []
 
 # Action mapping for easy dispatch
 ACTION_HANDLERS = {
@@ -692,20 +717,18 @@ ACTION_HANDLERS = {
 
 def execute_action(game, socket_id: str, action_type: str, action_data: Dict[str, Any]) -> Dict[str, Any]:
     """Execute a player action"""
-    if action_type not in ACTION_HANDLERS:
+    handler = ACTION_HANDLERS.get(action_type)
+    if handler is None:
         return {"success": False, "reason": f"Unknown action type: {action_type}"}
     
-    handler = ACTION_HANDLERS[action_type]
-    
     try:
         result = handler(game, socket_id, action_data)
-        
-        # Update game state after action
-        if result.get("success"):
-            game.last_updated = datetime.now()
-        
-        return result
-    
     except Exception as e:
-        logging.error(f"Error executing action {action_type} for player {socket_id}: {e}")
-        return {"success": False, "reason": f"Internal error: {str(e)}"}
\ No newline at end of file
+        logger.exception("Error executing action %s for player %s", action_type, socket_id)
+        return {"success": False, "reason": f"Internal error: {str(e)}"}
+    
+    # Update game state after action
+    if result.get("success"):
+        game.last_updated = time.time()
+    
+    return result
\ No newline at end of file
@@ -3,9 +3,11 @@ Board class for NMB Game.
 Manages the multi-floor 3D map, path tiles, zones, and special locations.
 """
 
-from typing import Dict, List, Tuple, Optional, Set, Any
+from typing import Dict, List, Tuple, Optional, Set, Any, Sequence
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+import functools
 import uuid
 import random
 
@@ -14,8 +16,44 @@ from .constants import (
     PathTileType, SpecialSquareType, INITIAL_POSITION, ZONE_NAME_CARDS,
     MAP_CORRUPTION_LIMIT, calculate_corruption_percentage, is_game_lost
 )
+from ._fast import (
+    CELL_EMPTY, CELL_TILE, CELL_CORRUPTED, new_grid, mark_corruption_candidates
+)
+
+# Valid floor numbers, checked by every position constructed
+_FLOORS = range(*FLOOR_RANGE)
+_BOARD_W, _BOARD_H = BOARD_SIZE
+_SUB_W, _SUB_H = _BOARD_W * 4, _BOARD_H * 4  # Board size in sub-positions
+_SUB_CELLS = FLOOR_COUNT * _SUB_H * _SUB_W
+
+# (dx, dy) offsets of the 8 surrounding tiles or sub-positions
+_NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# Square types that trigger an effect when a player ends a move on them
+_MOVE_END_SQUARES = frozenset((
+    SpecialSquareType.EVENT_SQUARE, SpecialSquareType.ITEM_SQUARE, SpecialSquareType.EMERGENCY_DOOR
+))
+
+# The 16 squares of a tile in x-major order, and the layout every default tile starts from
+_TILE_SQUARES = tuple((x, y) for x in range(4) for y in range(4))
+_NORMAL_LAYOUT = dict.fromkeys(_TILE_SQUARES, SpecialSquareType.NORMAL)
 
-@dataclass
+# Square types that can always be moved onto (walls never can, see can_enter_square)
+_ALWAYS_MOVABLE_SQUARES = frozenset((
+    SpecialSquareType.NORMAL, SpecialSquareType.EVENT_SQUARE, SpecialSquareType.ITEM_SQUARE,
+    SpecialSquareType.EMERGENCY_DOOR, SpecialSquareType.STAIRWELL, SpecialSquareType.ELEVATOR_ROOM
+))
+
+# Every edge between orthogonally adjacent squares of a 4x4 tile, shared by all default tiles
+_DEFAULT_CONNECTIONS = tuple(
+    ((x, y), (x + dx, y + dy))
+    for x in range(4)
+    for y in range(4)
+    for dx, dy in ((0, 1), (1, 0), (0, -1), (-1, 0))
+    if 0 <= x + dx < 4 and 0 <= y + dy < 4
+)
+
+@dataclass(slots=True)
 class TilePosition:
     """Represents a tile position on the board (for tile placement)"""
     x: int  # Tile grid X (0-9)
@@ -24,39 +62,38 @@ class TilePosition:
     
     def __post_init__(self):
         """Validate tile position bounds"""
-        if not (0 <= self.x < BOARD_SIZE[0] and 0 <= self.y < BOARD_SIZE[1]):
+        if not (0 <= self.x < _BOARD_W and 0 <= self.y < _BOARD_H):
             raise ValueError(f"Tile position ({self.x}, {self.y}) out of bounds")
-        if self.floor not in range(*FLOOR_RANGE):
+        if self.floor not in _FLOORS:
             raise ValueError(f"Floor {self.floor} out of range {FLOOR_RANGE}")
     
+    @classmethod
+    def _unchecked(cls, x: int, y: int, floor: int) -> 'TilePosition':
+        """Build a position already known to be in bounds, skipping __post_init__"""
+        pos = object.__new__(cls)
+        pos.x = x
+        pos.y = y
+        pos.floor = floor
+        return pos
+    
     def to_tuple(self) -> Tuple[int, int, int]:
         return (self.x, self.y, self.floor)
     
     def get_adjacent_positions(self, include_current_floor_only=False) -> List['TilePosition']:
         """Get adjacent tile positions for tile-level operations"""
         adjacent = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue  # Skip current position
-                
-                new_x, new_y = self.x + dx, self.y + dy
-                
-                # Check bounds
-                if 0 <= new_x < BOARD_SIZE[0] and 0 <= new_y < BOARD_SIZE[1]:
-                    try:
-                        if include_current_floor_only:
-                            adjacent.append(TilePosition(new_x, new_y, self.floor))
-                        else:
-                            # Include all floors for full adjacency
-                            for floor in range(*FLOOR_RANGE):
-                                adjacent.append(TilePosition(new_x, new_y, floor))
-                    except ValueError:
-                        continue  # Skip invalid positions
+        floors = (self.floor,) if include_current_floor_only else _FLOORS
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            new_x, new_y = self.x + dx, self.y + dy
+            
+            # Check bounds (the floors are valid already)
+            if 0 <= new_x < _BOARD_W and 0 <= new_y < _BOARD_H:
+                for floor in floors:
+                    adjacent.append(TilePosition._unchecked(new_x, new_y, floor))
         
         return adjacent
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a sub-position on the board (for player movement)"""
     tile_x: int    # Which tile (0-3)
@@ -67,11 +104,11 @@ class Position:
     
     def __post_init__(self):
         """Validate position bounds"""
-        if not (0 <= self.tile_x < BOARD_SIZE[0] and 0 <= self.tile_y < BOARD_SIZE[1]):
+        if not (0 <= self.tile_x < _BOARD_W and 0 <= self.tile_y < _BOARD_H):
             raise ValueError(f"Tile position ({self.tile_x}, {self.tile_y}) out of bounds")
         if not (0 <= self.sub_x < 4 and 0 <= self.sub_y < 4):
             raise ValueError(f"Sub-position ({self.sub_x}, {self.sub_y}) out of bounds (must be 0-3)")
-        if self.floor not in range(*FLOOR_RANGE):
+        if self.floor not in _FLOORS:
             raise ValueError(f"Floor {self.floor} out of range {FLOOR_RANGE}")
     
     def __hash__(self):
@@ -84,6 +121,17 @@ class Position:
                    self.floor == other.floor)
         return False
     
+    @classmethod
+    def _unchecked(cls, tile_x: int, tile_y: int, sub_x: int, sub_y: int, floor: int) -> 'Position':
+        """Build a position already known to be in bounds, skipping __post_init__"""
+        pos = object.__new__(cls)
+        pos.tile_x = tile_x
+        pos.tile_y = tile_y
+        pos.sub_x = sub_x
+        pos.sub_y = sub_y
+        pos.floor = floor
+        return pos
+    
     def to_tuple(self) -> Tuple[int, int, int, int, int]:
         """Convert to tuple for easy comparison"""
         return (self.tile_x, self.tile_y, self.sub_x, self.sub_y, self.floor)
@@ -100,49 +148,34 @@ class Position:
     
     def get_adjacent_positions(self, include_current_floor_only=False) -> List['Position']:
         """Get all adjacent sub-positions (within same tile and adjacent tiles)"""
+        if include_current_floor_only:
+            return list(_same_floor_neighbors(self.tile_x, self.tile_y, self.sub_x, self.sub_y, self.floor))
+        return self._build_adjacent_positions(_FLOORS)
+    
+    def _build_adjacent_positions(self, floors) -> List['Position']:
+        """Construct the adjacent sub-positions on each of the given floors"""
         adjacent = []
         
-        # Adjacent positions within same tile and adjacent tiles
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue  # Skip current position
-                
-                new_sub_x = self.sub_x + dx
-                new_sub_y = self.sub_y + dy
-                new_tile_x = self.tile_x
-                new_tile_y = self.tile_y
-                
-                # Handle crossing tile boundaries
-                if new_sub_x < 0:
-                    new_tile_x -= 1
-                    new_sub_x = 3
-                elif new_sub_x > 3:
-                    new_tile_x += 1
-                    new_sub_x = 0
-                    
-                if new_sub_y < 0:
-                    new_tile_y -= 1
-                    new_sub_y = 3
-                elif new_sub_y > 3:
-                    new_tile_y += 1
-                    new_sub_y = 0
-                
-                # Check tile bounds
-                if 0 <= new_tile_x < BOARD_SIZE[0] and 0 <= new_tile_y < BOARD_SIZE[1]:
-                    try:
-                        if include_current_floor_only:
-                            adjacent.append(Position(new_tile_x, new_tile_y, new_sub_x, new_sub_y, self.floor))
-                        else:
-                            # Include all floors for full adjacency
-                            for floor in range(*FLOOR_RANGE):
-                                adjacent.append(Position(new_tile_x, new_tile_y, new_sub_x, new_sub_y, floor))
-                    except ValueError:
-                        continue  # Skip invalid positions
+        # Step in absolute sub-position coordinates, then split back into tile and sub
+        abs_x = self.tile_x * 4 + self.sub_x
+        abs_y = self.tile_y * 4 + self.sub_y
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            new_x = abs_x + dx
+            new_y = abs_y + dy
+            
+            # Check board bounds (floors are valid by construction)
+            if 0 <= new_x < _SUB_W and 0 <= new_y < _SUB_H:
+                for floor in floors:
+                    adjacent.append(Position._unchecked(new_x >> 2, new_y >> 2, new_x & 3, new_y & 3, floor))
         
         return adjacent
 
-@dataclass 
+@functools.lru_cache(maxsize=None)
+def _same_floor_neighbors(tile_x: int, tile_y: int, sub_x: int, sub_y: int, floor: int) -> Tuple[Position, ...]:
+    """Same-floor neighbours of a sub-position, built once per cell (the instances are shared, don't modify them)"""
+    return tuple(Position._unchecked(tile_x, tile_y, sub_x, sub_y, floor)._build_adjacent_positions((floor,)))
+
+@dataclass(slots=True)
 class PathTile:
     """Represents a path tile on the board"""
     tile_id: str
@@ -155,6 +188,11 @@ class PathTile:
     is_removed: bool = False  # For stairwells that are removed after use
     connections: List[Tuple[int, int]] = field(default_factory=list)  # Valid paths within tile
     movable_positions: Set[Tuple[int, int]] = field(default_factory=set)  # Which sub-positions can be moved to
+    _has_move_end_effect: bool = field(default=False, init=False, repr=False, compare=False)
+    _center_square_type: SpecialSquareType = field(default=SpecialSquareType.NORMAL, init=False, repr=False, compare=False)
+    _entrance_points: Optional[List[Tuple[int, int]]] = field(default=None, init=False, repr=False, compare=False)
+    _movable_mask: int = field(default=0, init=False, repr=False, compare=False)  # Bit x*4+y set per movable sub-position
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)  # See to_dict
     
     def __post_init__(self):
         """Initialize tile with default layout"""
@@ -172,26 +210,39 @@ class PathTile:
         # Generate movable positions based on special squares
         if not self.movable_positions:
             self.movable_positions = self._generate_movable_positions()
+        
+        self._refresh_square_cache()
+    
+    def _refresh_square_cache(self) -> None:
+        """Recompute the data derived from special_squares and movable_positions.
+        
+        Call after changing either of them on an existing tile.
+        """
+        self._movable_mask = 0
+        for sub_x, sub_y in self.movable_positions:
+            self._movable_mask |= 1 << (sub_x * 4 + sub_y)
+        
+        # Lets movement skip the tile effect check on plain tiles
+        self._has_move_end_effect = not _MOVE_END_SQUARES.isdisjoint(self.special_squares.values())
+        self._center_square_type = self.special_squares.get((1, 1), SpecialSquareType.NORMAL)
+        self._entrance_points = self._compute_entrance_points()
+        self._dict_cache = None
     
     def _generate_default_layout(self) -> Dict[Tuple[int, int], SpecialSquareType]:
         """Generate default 4x4 tile layout"""
-        layout = {}
-        
-        # Fill with normal squares
-        for x in range(4):
-            for y in range(4):
-                layout[(x, y)] = SpecialSquareType.NORMAL
+        # Start from all normal squares
+        layout = _NORMAL_LAYOUT.copy()
         
         # Add special squares based on tile type
-        if self.tile_type == PathTileType.STAIRWELL:
+        if self.tile_type is PathTileType.STAIRWELL:
             layout[(1, 1)] = SpecialSquareType.STAIRWELL
             layout[(2, 2)] = SpecialSquareType.STAIRWELL
-        elif self.tile_type == PathTileType.ELEVATOR:
+        elif self.tile_type is PathTileType.ELEVATOR:
             layout[(1, 1)] = SpecialSquareType.ELEVATOR_ROOM
             layout[(2, 1)] = SpecialSquareType.ELEVATOR_ROOM
             layout[(1, 2)] = SpecialSquareType.ELEVATOR_ROOM
             layout[(2, 2)] = SpecialSquareType.ELEVATOR_ROOM
-        elif self.tile_type == PathTileType.BASIC:
+        elif self.tile_type is PathTileType.BASIC:
             # Add some random special squares
             if random.random() < 0.3:  # 30% chance
                 layout[(random.randint(0, 3), random.randint(0, 3))] = SpecialSquareType.EVENT_SQUARE
@@ -200,42 +251,27 @@ class PathTile:
         
         return layout
     
-    def _generate_default_connections(self) -> List[Tuple[int, int]]:
-        """Generate default path connections within tile"""
-        connections = []
-        
-        # Create basic cross pattern for normal tiles
-        for x in range(4):
-            for y in range(4):
-                # Connect to adjacent squares
-                for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                    nx, ny = x + dx, y + dy
-                    if 0 <= nx < 4 and 0 <= ny < 4:
-                        connections.append(((x, y), (nx, ny)))
-        
-        return connections
+    def _generate_default_connections(self) -> Sequence[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Generate default path connections within tile (shared and read-only)"""
+        return _DEFAULT_CONNECTIONS
     
     def _generate_movable_positions(self) -> Set[Tuple[int, int]]:
         """Generate which sub-positions within this tile can be moved to"""
-        movable = set()
+        special_squares = self.special_squares
         
-        for x in range(4):
-            for y in range(4):
-                square_type = self.special_squares.get((x, y), SpecialSquareType.NORMAL)
-                
-                # For now, randomly make some positions movable (later we can define this manually)
-                if square_type == SpecialSquareType.WALL:
-                    # Walls are never movable (except with high disorder)
-                    continue
-                elif square_type in [SpecialSquareType.NORMAL, SpecialSquareType.EVENT_SQUARE, 
-                                   SpecialSquareType.ITEM_SQUARE, SpecialSquareType.EMERGENCY_DOOR,
-                                   SpecialSquareType.STAIRWELL, SpecialSquareType.ELEVATOR_ROOM]:
-                    # These are always movable
-                    movable.add((x, y))
-                else:
-                    # For other types, randomly decide (70% chance movable)
-                    if random.random() < 0.7:
-                        movable.add((x, y))
+        # Squares are normal (always movable) unless the layout says otherwise
+        movable = set(_TILE_SQUARES)
+        for pos, square_type in special_squares.items():
+            if pos not in movable or square_type in _ALWAYS_MOVABLE_SQUARES:
+                continue
+            
+            # For now, randomly make some positions movable (later we can define this manually)
+            if square_type is SpecialSquareType.WALL:
+                # Walls are never movable (except with high disorder)
+                movable.discard(pos)
+            elif random.random() >= 0.7:
+                # For other types, randomly decide (70% chance movable)
+                movable.discard(pos)
         
         # Ensure at least some positions are movable
         if not movable:
@@ -247,10 +283,10 @@ class PathTile:
     def can_enter_square(self, local_pos: Tuple[int, int], player_disorder: int = 0) -> bool:
         """Check if a sub-position within this tile can be entered"""
         # First check if it's a movable position
-        if local_pos not in self.movable_positions:
+        if not self.is_position_movable(local_pos):
             # Check if it's a wall that high disorder can pass through
             square_type = self.special_squares.get(local_pos, SpecialSquareType.NORMAL)
-            if square_type == SpecialSquareType.WALL:
+            if square_type is SpecialSquareType.WALL:
                 from .constants import can_pass_walls
                 return can_pass_walls(player_disorder)
             return False
@@ -259,10 +295,18 @@ class PathTile:
     
     def is_position_movable(self, local_pos: Tuple[int, int]) -> bool:
         """Check if a sub-position within this tile is movable"""
-        return local_pos in self.movable_positions
+        sub_x, sub_y = local_pos
+        if not (0 <= sub_x < 4 and 0 <= sub_y < 4):
+            return False
+        return (self._movable_mask >> (sub_x * 4 + sub_y)) & 1 == 1
     
     def get_entrance_points(self) -> List[Tuple[int, int]]:
         """Get valid entrance points to this tile"""
+        # Precomputed by _refresh_square_cache
+        return self._entrance_points
+    
+    def _compute_entrance_points(self) -> List[Tuple[int, int]]:
+        """Collect the movable edge positions of this tile"""
         # Return all movable positions on the edges of the tile
         entrance_points = []
         
@@ -284,7 +328,17 @@ class PathTile:
         return entrance_points if entrance_points else [(1, 1)]  # Fallback to center
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert tile to dictionary for serialization"""
+        """Convert tile to dictionary for serialization.
+        
+        The dict is built once and shared between calls, so it must not be modified.
+        Set _dict_cache to None after changing a placed tile.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Serialize the tile's current fields"""
         return {
             "tile_id": self.tile_id,
             "tile_type": self.tile_type.value,
@@ -308,14 +362,17 @@ class Board:
     
     def __init__(self):
         # Multi-floor tile storage: floor -> (x,y) -> PathTile
+        # Only tiles currently on the board live here; remove_tile pops them out
         self.floors: Dict[int, Dict[Tuple[int, int], PathTile]] = {}
         
         # Initialize empty floors
-        for floor in range(*FLOOR_RANGE):
+        for floor in _FLOORS:
             self.floors[floor] = {}
+        self._tiles_by_id: Dict[str, PathTile] = {}  # tile_id -> tile, mirrors self.floors
         
         # Zone management
         self.zone_assignments: Dict[Tuple[int, int], str] = {}  # (x,y) -> zone letter
+        self.positions_by_zone: Dict[str, List[Tuple[int, int]]] = {zone: [] for zone in ZONES}  # Inverse of zone_assignments
         self.zone_names: Dict[str, Optional[str]] = {zone: None for zone in ZONES}
         self.available_zone_names = ZONE_NAME_CARDS.copy()
         random.shuffle(self.available_zone_names)
@@ -324,6 +381,15 @@ class Board:
         self.corrupted_tiles: Set[str] = set()  # tile_ids
         self.corruption_spread_rate = 0.0
         
+        # Dense per-cell tile state mirroring self.floors (see _fast.py)
+        grid_size = FLOOR_COUNT * BOARD_SIZE[1] * BOARD_SIZE[0]
+        self._tile_grid = new_grid(grid_size)
+        self._candidate_grid = new_grid(grid_size)
+        
+        # Per sub-position movability for is_position_movable, updated one tile block at a time
+        # (see _write_tile_block). A bytearray is cheaper than a NumPy grid for single-cell reads
+        self._movable = bytearray(_SUB_CELLS)
+        
         # Special locations
         self.stairwells: Dict[int, List[Position]] = {}  # floor -> list of stairwell positions
         self.elevators: Dict[int, List[Position]] = {}   # floor -> list of elevator positions
@@ -343,7 +409,7 @@ class Board:
         )
         
         self.place_tile(initial_tile)
-        self.zone_assignments[(INITIAL_POSITION[0], INITIAL_POSITION[1])] = "B"
+        self.set_zone((INITIAL_POSITION[0], INITIAL_POSITION[1]), "B")
     
     # =============================================================================
     # TILE MANAGEMENT
@@ -359,16 +425,22 @@ class Board:
             return False
         
         # For non-initial tiles, check adjacency
-        if tile.tile_type != PathTileType.INITIAL:
+        if tile.tile_type is not PathTileType.INITIAL:
             if not self._has_adjacent_tile(tile.position):
                 return False
         
         # Place the tile
         self.floors[floor][pos_key] = tile
+        self._tiles_by_id[tile.tile_id] = tile
+        self._tile_grid[self._cell_index(floor, pos_key[0], pos_key[1])] = (
+            CELL_CORRUPTED if tile.tile_id in self.corrupted_tiles else CELL_TILE
+        )
+        self._write_tile_block(floor, pos_key[0], pos_key[1], None if tile.is_corrupted else tile)
         
         # Assign zone if needed
         if not tile.zone:
             tile.zone = self._assign_zone(tile.position)
+        tile._dict_cache = None
         
         # Update special location tracking
         self._update_special_locations(tile)
@@ -384,9 +456,13 @@ class Board:
         if pos_key in self.floors[floor]:
             tile = self.floors[floor].pop(pos_key)
             tile.is_removed = True
+            tile._dict_cache = None
+            self._tiles_by_id.pop(tile.tile_id, None)
+            self._tile_grid[self._cell_index(floor, pos_key[0], pos_key[1])] = CELL_EMPTY
+            self._write_tile_block(floor, pos_key[0], pos_key[1], None)
             
             # Remove from special locations
-            if tile.tile_type == PathTileType.STAIRWELL:
+            if tile.tile_type is PathTileType.STAIRWELL:
                 if floor in self.stairwells:
                     self.stairwells[floor] = [p for p in self.stairwells[floor] if p != position]
             
@@ -395,6 +471,10 @@ class Board:
         
         return None
     
+    def _cell_index(self, floor: int, x: int, y: int) -> int:
+        """Index of a tile position in the flat dense grids"""
+        return ((floor - _FLOORS.start) * _BOARD_H + y) * _BOARD_W + x
+    
     def get_tile_at_tile_pos(self, tile_position: TilePosition) -> Optional[PathTile]:
         """Get tile at specific tile position"""
         floor = tile_position.floor
@@ -403,8 +483,11 @@ class Board:
     
     def get_tile_at_position(self, position: Position) -> Optional[PathTile]:
         """Get tile that contains the specified sub-position"""
-        tile_pos = TilePosition(position.tile_x, position.tile_y, position.floor)
-        return self.get_tile_at_tile_pos(tile_pos)
+        return self.floors[position.floor].get((position.tile_x, position.tile_y))
+    
+    def get_tile_xyz(self, x: int, y: int, floor: int) -> Optional[PathTile]:
+        """Get tile at raw tile coordinates, without building a position object"""
+        return self.floors[floor].get((x, y))
     
     def get_tile(self, position) -> Optional[PathTile]:
         """Get tile at position (supports both TilePosition and Position)"""
@@ -420,23 +503,15 @@ class Board:
     
     def is_position_movable(self, position: Position) -> bool:
         """Check if a sub-position can be moved to"""
-        tile = self.get_tile_at_position(position)
-        if not tile:
-            return False
-        
-        if tile.is_corrupted or tile.is_removed:
-            return False
-        
-        return tile.is_position_movable((position.sub_x, position.sub_y))
+        return self._movable[self._sub_index(position)] == 1
     
     def _has_adjacent_tile(self, position) -> bool:
         """Check if position has at least one adjacent tile"""
         if isinstance(position, TilePosition):
-            # For tile placement, check adjacent tile positions
-            adjacent_tile_positions = position.get_adjacent_positions(include_current_floor_only=True)
-            
-            for adj_tile_pos in adjacent_tile_positions:
-                if self.get_tile_at_tile_pos(adj_tile_pos) is not None:
+            # For tile placement, probe the 8 neighbouring (x, y) keys on the same floor directly
+            floor_tiles = self.floors[position.floor]
+            for dx, dy in _NEIGHBOR_OFFSETS:
+                if (position.x + dx, position.y + dy) in floor_tiles:
                     return True
         else:
             # For sub-position checks, check adjacent sub-positions
@@ -452,12 +527,12 @@ class Board:
         """Update tracking of special locations"""
         floor = tile.position.floor
         
-        if tile.tile_type == PathTileType.STAIRWELL:
+        if tile.tile_type is PathTileType.STAIRWELL:
             if floor not in self.stairwells:
                 self.stairwells[floor] = []
             self.stairwells[floor].append(tile.position)
         
-        elif tile.tile_type == PathTileType.ELEVATOR:
+        elif tile.tile_type is PathTileType.ELEVATOR:
             if floor not in self.elevators:
                 self.elevators[floor] = []
             self.elevators[floor].append(tile.position)
@@ -496,13 +571,23 @@ class Board:
             chosen_zone = random.choice(list(adjacent_zones))
         else:
             # Assign new zone
-            unassigned_zones = [zone for zone in ZONES 
-                              if zone not in self.zone_assignments.values()]
+            unassigned_zones = [zone for zone in ZONES if not self.positions_by_zone[zone]]
             chosen_zone = random.choice(unassigned_zones) if unassigned_zones else random.choice(ZONES)
         
-        self.zone_assignments[pos_key] = chosen_zone
+        self.set_zone(pos_key, chosen_zone)
         return chosen_zone
     
+    def set_zone(self, pos_key: Tuple[int, int], zone: str) -> None:
+        """Assign a zone to a tile (x, y), keeping positions_by_zone in step"""
+        old_zone = self.zone_assignments.get(pos_key)
+        if old_zone == zone:
+            return
+        if old_zone is not None:
+            self.positions_by_zone[old_zone].remove(pos_key)
+        
+        self.zone_assignments[pos_key] = zone
+        self.positions_by_zone.setdefault(zone, []).append(pos_key)
+    
     def reveal_zone_name(self, zone_letter: str) -> Optional[str]:
         """Reveal the name of a zone"""
         if zone_letter not in ZONES:
@@ -514,8 +599,8 @@ class Board:
         if not self.available_zone_names:
             return None
         
-        # Assign random name
-        zone_name = self.available_zone_names.pop(0)
+        # Assign random name (the list is shuffled, so draw from the cheap end)
+        zone_name = self.available_zone_names.pop()
         self.zone_names[zone_letter] = zone_name
         
         # Check for duplicates (causes reshuffle in actual game)
@@ -546,33 +631,40 @@ class Board:
     
     def corrupt_tile(self, tile_id: str) -> bool:
         """Mark a tile as corrupted"""
-        if tile_id not in self.corrupted_tiles:
-            self.corrupted_tiles.add(tile_id)
-            print(f"Tile {tile_id} became corrupted")
-            return True
-        return False
+        if tile_id in self.corrupted_tiles:
+            return False
+        self._mark_corrupted(tile_id, self._find_tile_by_id(tile_id))
+        return True
+    
+    def _mark_corrupted(self, tile_id: str, tile: Optional[PathTile]) -> None:
+        """Record a not yet corrupted tile as corrupted, for callers that already hold the tile"""
+        self.corrupted_tiles.add(tile_id)
+        if tile:
+            self._tile_grid[self._cell_index(tile.position.floor, tile.position.x, tile.position.y)] = CELL_CORRUPTED
+        print(f"Tile {tile_id} became corrupted")
     
     def spread_corruption(self, spread_rate: float = 0.05) -> List[str]:
         """Spread corruption to adjacent tiles"""
         newly_corrupted = []
-        all_tiles = self.get_all_tiles()
         
         # Find tiles adjacent to corrupted ones
-        corruption_candidates = set()
-        for tile_id in self.corrupted_tiles:
-            tile = self._find_tile_by_id(tile_id)
-            if tile:
-                adjacent_positions = tile.position.get_adjacent_positions(include_current_floor_only=True)
-                for adj_pos in adjacent_positions:
-                    adj_tile = self.get_tile(adj_pos)
-                    if adj_tile and adj_tile.tile_id not in self.corrupted_tiles:
-                        corruption_candidates.add(adj_tile.tile_id)
-        
-        # Randomly corrupt some candidates
-        for candidate_id in corruption_candidates:
-            if random.random() < spread_rate:
-                if self.corrupt_tile(candidate_id):
-                    newly_corrupted.append(candidate_id)
+        candidate_grid = self._candidate_grid
+        if not mark_corruption_candidates(self._tile_grid, candidate_grid,
+                                          FLOOR_COUNT, BOARD_SIZE[1], BOARD_SIZE[0]):
+            return newly_corrupted
+        
+        corruption_candidates = [
+            tile
+            for floor, floor_tiles in self.floors.items()
+            for (x, y), tile in floor_tiles.items()
+            if candidate_grid[self._cell_index(floor, x, y)]
+        ]
+        
+        # Randomly corrupt some candidates (we hold the tiles, so skip the id lookup)
+        for tile in corruption_candidates:
+            if random.random() < spread_rate and tile.tile_id not in self.corrupted_tiles:
+                self._mark_corrupted(tile.tile_id, tile)
+                newly_corrupted.append(tile.tile_id)
         
         return newly_corrupted
     
@@ -592,27 +684,28 @@ class Board:
     def get_valid_moves_from_position(self, position: Position, movement_points: int, 
                                      player_disorder: int = 0) -> List[Position]:
         """Get all valid positions reachable with given movement points"""
-        valid_positions = set()
-        to_check = [(position, 0)]  # (position, movement_used)
-        checked = set()
+        # Breadth-first, so the first visit to a position is its cheapest; mark on enqueue
+        valid_positions = []
+        to_check = deque([(position, 0)])  # (position, movement_used)
+        checked = {position.to_tuple()}
         
         while to_check:
-            current_pos, movement_used = to_check.pop(0)
+            current_pos, movement_used = to_check.popleft()
             
-            if movement_used > movement_points:
-                continue
+            if movement_used > 0:  # Don't include starting position
+                valid_positions.append(current_pos)
             
-            pos_key = current_pos.to_tuple()
-            if pos_key in checked:
+            if movement_used >= movement_points:
                 continue
-            checked.add(pos_key)
-            
-            if movement_used > 0:  # Don't include starting position
-                valid_positions.add(current_pos)
             
             # Get adjacent positions
             adjacent = current_pos.get_adjacent_positions(include_current_floor_only=True)
             for adj_pos in adjacent:
+                pos_key = adj_pos.to_tuple()
+                if pos_key in checked:
+                    continue
+                checked.add(pos_key)
+                
                 tile = self.get_tile(adj_pos)
                 if tile and not tile.is_corrupted and not tile.is_removed:
                     # Check if player can enter this tile
@@ -620,22 +713,27 @@ class Board:
                     if entrance_points:  # If there are valid entrance points
                         to_check.append((adj_pos, movement_used + 1))
         
-        return list(valid_positions)
+        return valid_positions
     
     def find_path(self, start: Position, end: Position, player_disorder: int = 0) -> Optional[List[Position]]:
         """Find path between two positions using A* algorithm"""
         from heapq import heappush, heappop
+        from itertools import count
         
         def heuristic(pos1: Position, pos2: Position) -> float:
-            return abs(pos1.x - pos2.x) + abs(pos1.y - pos2.y) + abs(pos1.floor - pos2.floor) * 2
+            x1, y1 = pos1.to_absolute_coords()
+            x2, y2 = pos2.to_absolute_coords()
+            return abs(x1 - x2) + abs(y1 - y2) + abs(pos1.floor - pos2.floor) * 2
         
-        open_set = [(0, start)]
+        # Positions do not order, so score ties are broken by insertion order
+        tie_breaker = count()
+        open_set = [(0, next(tie_breaker), start)]
         came_from = {}
         g_score = {start: 0}
         f_score = {start: heuristic(start, end)}
         
         while open_set:
-            current = heappop(open_set)[1]
+            current = heappop(open_set)[2]
             
             if current == end:
                 # Reconstruct path
@@ -659,10 +757,26 @@ class Board:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
                     f_score[neighbor] = tentative_g + heuristic(neighbor, end)
-                    heappush(open_set, (f_score[neighbor], neighbor))
+                    heappush(open_set, (f_score[neighbor], next(tie_breaker), neighbor))
         
         return None  # No path found
     
+    def _sub_index(self, position: Position) -> int:
+        """Index of a sub-position in the flat movability grid"""
+        return (((position.floor - _FLOORS.start) * _SUB_H + position.tile_y * 4 + position.sub_y) * _SUB_W
+                + position.tile_x * 4 + position.sub_x)
+    
+    def _write_tile_block(self, floor: int, x: int, y: int, tile: Optional[PathTile]) -> None:
+        """Set the 4x4 movable cells of a tile position from tile (None blocks them all)"""
+        movable = self._movable
+        corner = ((floor - _FLOORS.start) * _SUB_H + y * 4) * _SUB_W + x * 4
+        for row in range(corner, corner + 4 * _SUB_W, _SUB_W):
+            movable[row:row + 4] = bytes(4)
+        
+        if tile is not None:
+            for sub_x, sub_y in tile.movable_positions:
+                movable[corner + sub_y * _SUB_W + sub_x] = 1
+    
     # =============================================================================
     # UTILITY METHODS
     # =============================================================================
@@ -672,12 +786,12 @@ class Board:
         tiles = []
         for floor_tiles in self.floors.values():
             tiles.extend(floor_tiles.values())
-        return [tile for tile in tiles if not tile.is_removed]
+        return tiles
     
     def get_tiles_on_floor(self, floor: int) -> List[PathTile]:
         """Get all tiles on a specific floor"""
         if floor in self.floors:
-            return [tile for tile in self.floors[floor].values() if not tile.is_removed]
+            return list(self.floors[floor].values())
         return []
     
     def get_players_on_tile(self, position: Position, players: List) -> List:
@@ -688,11 +802,7 @@ class Board:
     
     def _find_tile_by_id(self, tile_id: str) -> Optional[PathTile]:
         """Find tile by its ID"""
-        for floor_tiles in self.floors.values():
-            for tile in floor_tiles.values():
-                if tile.tile_id == tile_id:
-                    return tile
-        return None
+        return self._tiles_by_id.get(tile_id)
     
     def get_board_state(self) -> Dict[str, Any]:
         """Get current board state for serialization"""
@@ -701,7 +811,6 @@ class Board:
                 str(floor): {
                     f"{pos[0]},{pos[1]}": tile.to_dict()
                     for pos, tile in floor_tiles.items()
-                    if not tile.is_removed
                 }
                 for floor, floor_tiles in self.floors.items()
             },
@@ -4,6 +4,8 @@ Handles all card types: Path tiles, Effect cards, Items, Anomalies, Button cards
 """
 
 from typing import Dict, List, Optional, Any, Callable
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
@@ -15,6 +17,21 @@ from .constants import (
     DECK_SIZES, ZONES, ZONE_NAME_CARDS, ActionType
 )
 
+# Generated path tile layouts, keyed by their contents. Most cards come out identical
+# (e.g. every stairwell), so cards with equal layouts share one read-only dict
+_LAYOUT_CACHE: Dict[frozenset, Dict[tuple, SpecialSquareType]] = {}
+
+def _intern_layout(layout: Dict[tuple, SpecialSquareType]) -> Dict[tuple, SpecialSquareType]:
+    """Return the shared dict equal to layout, registering layout if it is new"""
+    return _LAYOUT_CACHE.setdefault(frozenset(layout.items()), layout)
+
+# Where each square of a 4x4 tile ends up for each clockwise rotation
+_LAYOUT_ROTATIONS: Dict[int, Dict[tuple, tuple]] = {
+    90: {(x, y): (3 - y, x) for x in range(4) for y in range(4)},
+    180: {(x, y): (3 - x, 3 - y) for x in range(4) for y in range(4)},
+    270: {(x, y): (y, 3 - x) for x in range(4) for y in range(4)},
+}
+
 class CardRarity(Enum):
     """Card rarity levels"""
     COMMON = "common"
@@ -66,10 +83,11 @@ class PathTileCard(BaseCard):
                  connections: List[tuple] = None, **kwargs):
         super().__init__(**kwargs)
         self.tile_type = tile_type
-        self.layout = layout or self._generate_default_layout()
+        # Generated and rotated layouts are shared between cards, so never modify them in place
+        self.layout = layout or _intern_layout(self._generate_default_layout())
         self.connections = connections or []
         self.rotation = 0
-        self.is_disordered = tile_type == PathTileType.DISORDERED
+        self.is_disordered = tile_type is PathTileType.DISORDERED
         
         # Set default name if not provided
         if not self.name:
@@ -88,15 +106,15 @@ class PathTileCard(BaseCard):
                 layout[(x, y)] = SpecialSquareType.NORMAL
         
         # Add special features based on tile type
-        if self.tile_type == PathTileType.STAIRWELL:
+        if self.tile_type is PathTileType.STAIRWELL:
             layout[(1, 1)] = SpecialSquareType.STAIRWELL
             layout[(2, 2)] = SpecialSquareType.STAIRWELL
-        elif self.tile_type == PathTileType.ELEVATOR:
+        elif self.tile_type is PathTileType.ELEVATOR:
             # 2x2 elevator room in center
             for x in range(1, 3):
                 for y in range(1, 3):
                     layout[(x, y)] = SpecialSquareType.ELEVATOR_ROOM
-        elif self.tile_type == PathTileType.BASIC:
+        elif self.tile_type is PathTileType.BASIC:
             # Random special squares
             special_count = random.randint(0, 2)
             special_types = [SpecialSquareType.EVENT_SQUARE, SpecialSquareType.ITEM_SQUARE, 
@@ -104,9 +122,9 @@ class PathTileCard(BaseCard):
             
             for _ in range(special_count):
                 x, y = random.randint(0, 3), random.randint(0, 3)
-                if layout.get((x, y)) == SpecialSquareType.NORMAL:
+                if layout.get((x, y)) is SpecialSquareType.NORMAL:
                     layout[(x, y)] = random.choice(special_types)
-        elif self.tile_type == PathTileType.DISORDERED:
+        elif self.tile_type is PathTileType.DISORDERED:
             # Add some walls to make it more dangerous
             wall_count = random.randint(2, 4)
             for _ in range(wall_count):
@@ -133,23 +151,11 @@ class PathTileCard(BaseCard):
         """Rotate the tile layout"""
         self.rotation = (self.rotation + degrees) % 360
         
-        if degrees % 90 == 0:  # Only rotate in 90-degree increments
-            # Rotate the layout dictionary
-            rotated_layout = {}
-            for (x, y), square_type in self.layout.items():
-                # Rotate coordinates
-                if degrees == 90:
-                    new_x, new_y = 3 - y, x
-                elif degrees == 180:
-                    new_x, new_y = 3 - x, 3 - y
-                elif degrees == 270:
-                    new_x, new_y = y, 3 - x
-                else:
-                    new_x, new_y = x, y
-                
-                rotated_layout[(new_x, new_y)] = square_type
-            
-            self.layout = rotated_layout
+        # Only 90, 180 and 270 move squares; other multiples of 90 leave the layout as is
+        rotation_map = _LAYOUT_ROTATIONS.get(degrees)
+        if rotation_map is not None:
+            rotated_layout = {rotation_map[pos]: square_type for pos, square_type in self.layout.items()}
+            self.layout = _intern_layout(rotated_layout)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -341,6 +347,9 @@ class ButtonCard(BaseCard):
         super().__init__(**kwargs)
         self.available_floors = available_floors or [1, 2, 3, 4, 5]
         self.available_zones = available_zones or random.sample(ZONES, random.randint(2, 4))
+        # Access never changes for a card's lifetime, so membership checks use sets
+        self._floors_set = frozenset(self.available_floors)
+        self._zones_set = frozenset(self.available_zones)
         
         if not self.name:
             self.name = f"Elevator Button {self.card_id[:4].upper()}"
@@ -355,11 +364,11 @@ class ButtonCard(BaseCard):
     
     def can_access_floor(self, floor: int) -> bool:
         """Check if this button allows access to a floor"""
-        return floor in self.available_floors
+        return floor in self._floors_set
     
     def can_access_zone(self, zone: str) -> bool:
         """Check if this button allows access to a zone"""
-        return zone in self.available_zones
+        return zone in self._zones_set
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -416,27 +425,30 @@ class Deck:
     
     def __init__(self, deck_type: CardType, cards: List[BaseCard] = None):
         self.deck_type = deck_type
-        self.cards = cards or []
+        self.cards = deque(cards or [])  # Top of the deck on the left
         self.discarded = []
         self.drawn_count = 0
     
     def shuffle(self) -> None:
         """Shuffle the deck"""
-        random.shuffle(self.cards)
+        # Shuffle a list copy; random.shuffle on a deque would index into its middle
+        cards = list(self.cards)
+        random.shuffle(cards)
+        self.cards = deque(cards)
     
     def draw(self) -> Optional[BaseCard]:
         """Draw a card from the top of the deck"""
         if not self.cards:
             if self.discarded:
                 # Reshuffle discarded cards
-                self.cards = self.discarded.copy()
+                self.cards = deque(self.discarded)
                 self.discarded.clear()
                 self.shuffle()
             else:
                 return None
         
         if self.cards:
-            card = self.cards.pop(0)
+            card = self.cards.popleft()
             self.drawn_count += 1
             return card
         
@@ -452,7 +464,7 @@ class Deck:
     
     def peek(self, count: int = 1) -> List[BaseCard]:
         """Peek at top cards without drawing"""
-        return self.cards[:count]
+        return list(islice(self.cards, count))
     
     def cards_remaining(self) -> int:
         """Get number of cards remaining"""
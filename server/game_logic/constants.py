@@ -125,6 +125,9 @@ DECK_SIZES = {
 # Path tile types
 class PathTileType(Enum):
     """Types of path tiles"""
+    # Members are singletons, so identity hashing matches Enum equality without Enum's Python-level __hash__
+    __hash__ = object.__hash__
+    
     BASIC = "basic"
     DISORDERED = "disordered"
     CONSTRUCTION = "construction"
@@ -146,6 +149,8 @@ class EffectCardType(Enum):
 
 class SpecialSquareType(Enum):
     """Types of special squares on tiles"""
+    __hash__ = object.__hash__  # See PathTileType
+    
     NORMAL = "normal"
     STAIRWELL = "stairwell"
     ELEVATOR_ROOM = "elevator_room"
@@ -6,12 +6,13 @@ Orchestrates all game components: players, board, cards, turns, phases, and vict
 from typing import Dict, List, Optional, Tuple, Any, Callable
 from datetime import datetime
 import random
+import time
 import uuid
 import logging
 
 from .constants import *
 from .player import Player
-from .board import Board, Position, PathTile
+from .board import Board, Position, TilePosition, PathTile
 from .cards import *
 
 class GameState(Enum):
@@ -30,7 +31,7 @@ class Game:
         # Basic game info
         self.game_id = game_id or str(uuid.uuid4())[:6].upper()
         self.created_at = datetime.now()
-        self.last_updated = datetime.now()
+        self.last_updated = time.time()  # Epoch seconds, stamped on every action
         
         # Game state
         self.state = GameState.WAITING
@@ -38,6 +39,7 @@ class Game:
         self.round_number = 0
         self.turn_number = 0
         self.total_actions = 0
+        self.state_version = 0  # Bumped by GameManager whenever the game may have changed
         
         # Players
         self.players: Dict[str, Player] = {}  # socket_id -> Player
@@ -97,7 +99,7 @@ class Game:
             player.is_host = True
         
         self._log_event("player_joined", f"{player.name} joined the game as Player {self.player_numbers[player.socket_id]}")
-        self.last_updated = datetime.now()
+        self.last_updated = time.time()
         return True
     
     def remove_player(self, socket_id: str) -> Optional[Player]:
@@ -133,7 +135,7 @@ class Game:
             self.state = GameState.FINISHED
             self.defeat_reason = "All players left"
         
-        self.last_updated = datetime.now()
+        self.last_updated = time.time()
         return player
     
     def get_current_player(self) -> Optional[Player]:
@@ -471,7 +473,7 @@ class Game:
         # Add random escape exits on floor 5
         for _ in range(2):  # 2 escape exits
             x, y = random.randint(0, BOARD_SIZE[0]-1), random.randint(0, BOARD_SIZE[1]-1)
-            exit_pos = Position(x, y, ESCAPE_FLOOR)
+            exit_pos = TilePosition(x, y, ESCAPE_FLOOR)
             
             # Create escape tile if position is empty
             if not self.board.get_tile(exit_pos):
@@ -482,6 +484,7 @@ class Game:
                 )
                 # Add emergency door
                 escape_tile.special_squares[(1, 1)] = SpecialSquareType.EMERGENCY_DOOR
+                escape_tile._refresh_square_cache()
                 self.board.place_tile(escape_tile)
                 self.board.escape_exits.append(exit_pos)
         
@@ -651,10 +654,10 @@ class Game:
         }
         
         self.game_log.append(event)
-        logging.info(f"Game {self.game_id}: {message}")
+        logging.info("Game %s: %s", self.game_id, message)
     
     def get_game_state(self) -> Dict[str, Any]:
-        """Get complete game state for serialization"""
+        """Get complete game state for serialization (a snapshot that shares no mutable containers with the game)"""
         current_player = self.get_current_player()
         
         return {
@@ -665,13 +668,13 @@ class Game:
             "turn": self.turn_number,
             "total_actions": self.total_actions,
             "created_at": self.created_at.isoformat(),
-            "last_updated": self.last_updated.isoformat(),
+            "last_updated": datetime.fromtimestamp(self.last_updated).isoformat(),
             
             # Players
             "players": {sid: {**player.to_dict(), "player_number": self.player_numbers.get(sid, 1)} 
                        for sid, player in self.players.items()},
-            "player_numbers": self.player_numbers,
-            "player_order": self.player_order,
+            "player_numbers": dict(self.player_numbers),
+            "player_order": list(self.player_order),
             "current_player": current_player.socket_id if current_player else None,
             "host": self.host_socket_id,
             
@@ -682,12 +685,12 @@ class Game:
             "decks": {deck_type.value: deck.to_dict() for deck_type, deck in self.decks.items()},
             
             # Recent dice rolls
-            "dice_results": self.dice_results,
+            "dice_results": dict(self.dice_results),
             
             # Game progress
             "victory_condition_met": self.victory_condition_met,
             "victory_type": self.victory_type,
-            "winning_players": self.winning_players,
+            "winning_players": list(self.winning_players),
             "defeat_reason": self.defeat_reason,
             
             # Recent events
@@ -742,7 +745,7 @@ class Game:
         
         # Basic actions (only during normal gameplay)
         if player.get_remaining_movement() > 0:
-            actions.extend(["move", "explore" if can_explore(player.disorder) else "fall"])
+            actions.extend(["move", "explore" if player._can_explore else "fall"])
         
         # Interaction actions (if other players on same tile)
         same_tile_players = [
@@ -83,6 +83,14 @@ class PlayerInventory:
 class Player:
     """Represents a player in the NMB Game"""
     
+    __slots__ = (
+        'name', 'socket_id', 'player_id', 'created_at',
+        'disorder', '_can_explore', 'floor', 'position', 'current_tile_id',
+        'movement_points', 'movement_used', 'actions_taken', 'last_action', 'turn_active',
+        'inventory', 'is_host', 'is_connected', 'last_seen',
+        'escape_items_collected', 'experiment_reports_collected', 'stats'
+    )
+    
     def __init__(self, name: str, socket_id: str, player_id: str = None):
         # Basic player info
         self.name = name
@@ -92,6 +100,7 @@ class Player:
         
         # Game state  
         self.disorder = INITIAL_DISORDER
+        self._can_explore = can_explore(self.disorder)  # Derived from disorder; refreshed by update_disorder
         self.floor = INITIAL_FLOOR
         # Position - not set until game starts
         self.position = None  # Will be set when game starts
@@ -135,6 +144,7 @@ class Player:
         """Update player's disorder level"""
         old_disorder = self.disorder
         self.disorder = max(0, min(MAX_DISORDER, self.disorder + change))
+        self._can_explore = can_explore(self.disorder)
         
         # Update statistics
         if self.disorder > self.stats['max_disorder_reached']:
@@ -204,7 +214,7 @@ class Player:
     def can_perform_action(self, action_type: ActionType) -> Tuple[bool, str]:
         """Check if player can perform the specified action"""
         if action_type == ActionType.EXPLORE:
-            if not can_explore(self.disorder):
+            if not self._can_explore:
                 return False, f"Disorder too high ({self.disorder} >= {DISORDER_FALL_THRESHOLD}), must Fall"
             if self.get_remaining_movement() <= 0:
                 return False, "No movement points remaining"
@@ -363,7 +373,7 @@ class Player:
             "floor": self.floor,
             "position": self.position,
             "movement_remaining": self.get_remaining_movement(),
-            "can_explore": can_explore(self.disorder),
+            "can_explore": self._can_explore,
             "can_pass_walls": can_pass_walls(self.disorder),
             "inventory_slots": self.inventory.get_available_slots(),
             "escape_progress": {
@@ -399,9 +409,9 @@ class Player:
             "movement_points": self.movement_points,
             "movement_used": self.movement_used,
             "inventory": {
-                "items": self.inventory.items,
-                "effects": self.inventory.effects,
-                "hand": self.inventory.hand,
+                "items": list(self.inventory.items),
+                "effects": list(self.inventory.effects),
+                "hand": list(self.inventory.hand),
                 "slots_available": self.inventory.get_available_slots()
             },
             "is_host": self.is_host,
@@ -411,7 +421,7 @@ class Player:
                 "items": self.escape_items_collected,
                 "reports": self.experiment_reports_collected
             },
-            "stats": self.stats,
+            "stats": dict(self.stats),
             "created_at": self.created_at.isoformat(),
             "last_seen": self.last_seen.isoformat()
         }
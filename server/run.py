@@ -6,12 +6,35 @@ Main entry point for the NMB Game Flask server with SocketIO support.
 from flask import Flask
 from flask_socketio import SocketIO
 from flask_cors import CORS
+import atexit
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+except ImportError:  # Optional dependency - Socket.IO falls back to the standard json module
+    orjson = None
+
+# Keep Numba's compiled-kernel cache inside the server directory so restarts reuse it
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.numba_cache'))
 
 # Import our modules
 from api.routes import register_socket_handlers, register_http_routes
 from config import Config
+from game_logic._fast import warmup
+
+class OrjsonCodec:
+    """json-module stand-in backed by orjson, as expected by python-socketio"""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
 
 def create_app():
     """Application factory pattern"""
@@ -24,7 +47,9 @@ def create_app():
          methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
     
     # Initialize SocketIO
-    socketio = SocketIO(app, cors_allowed_origins="*", logger=False, engineio_logger=False)
+    socketio_options = {'json': OrjsonCodec} if orjson else {}
+    socketio = SocketIO(app, async_mode=app.config['SOCKETIO_ASYNC_MODE'], cors_allowed_origins="*",
+                        logger=False, engineio_logger=False, **socketio_options)
     
     # Register socket event handlers
     register_socket_handlers(socketio)
@@ -54,6 +79,14 @@ def create_app():
 if __name__ == '__main__':
     app, socketio = create_app()
     
+    # Handlers only enqueue records; a listener thread does the stderr writes
+    log_queue = queue.SimpleQueue()
+    log_listener = QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=app.config.get('LOG_LEVEL', 'INFO'), handlers=[QueueHandler(log_queue)],
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    
     # Suppress Werkzeug's default request logs
     log = logging.getLogger('werkzeug')
     log.setLevel(logging.ERROR)
@@ -68,4 +101,8 @@ if __name__ == '__main__':
     print(f"[WEB] Server will be accessible at http://localhost:{port}")
     print(f"[DEBUG] Debug mode: {debug}")
     
+    # Pay JIT compilation now rather than on the first player action
+    if warmup():
+        print("[OK] JIT kernels warm")
+    
     socketio.run(app, host=host, port=port, debug=debug)
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Shared pytest setup for the NMB Game server tests.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tests import the server packages (api, game_logic) the same way run.py does
+sys.path.insert(0, SERVER_DIR)
+
+# config.py refuses to import without a SECRET_KEY (ProductionConfig checks it at class creation)
+os.environ.setdefault("SECRET_KEY", "nmb-game-test-secret-key")
+
+@pytest.fixture
+def pure_fast(monkeypatch):
+    """A separate copy of game_logic._fast loaded as if Numba were not installed"""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.spec_from_file_location("_fast_pure", os.path.join(SERVER_DIR, "game_logic", "_fast.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert not module.HAVE_NUMBA
+    return module
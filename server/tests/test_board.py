@@ -0,0 +1,142 @@
+"""
+Tests for the Board class: movability and pathfinding.
+"""
+
+import random
+
+import pytest
+
+from game_logic.board import Board, PathTile, Position, TilePosition
+from game_logic.constants import PathTileType, BOARD_SIZE, FLOOR_RANGE
+
+def tile_level_movable(board, position):
+    """The movability check as done before the dense grid: tile lookup, flags, then the tile's set"""
+    tile = board.get_tile_at_position(position)
+    if not tile:
+        return False
+    if tile.is_corrupted or tile.is_removed:
+        return False
+    return (position.sub_x, position.sub_y) in tile.movable_positions
+
+def all_positions():
+    for floor in range(*FLOOR_RANGE):
+        for tile_x in range(BOARD_SIZE[0]):
+            for tile_y in range(BOARD_SIZE[1]):
+                for sub_x in range(4):
+                    for sub_y in range(4):
+                        yield Position(tile_x, tile_y, sub_x, sub_y, floor)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_is_position_movable_matches_tile_level_check(seed):
+    random.seed(seed)
+    board = Board()
+    tile_types = [PathTileType.BASIC, PathTileType.STAIRWELL, PathTileType.ELEVATOR, PathTileType.DISORDERED]
+    
+    for i in range(60):
+        tile = PathTile(tile_id=f"t{i}", tile_type=random.choice(tile_types),
+                        position=TilePosition(random.randrange(BOARD_SIZE[0]), random.randrange(BOARD_SIZE[1]),
+                                              random.choice([2, 2, 3])),
+                        is_corrupted=random.random() < 0.1)
+        board.place_tile(tile)
+        
+        tiles = board.get_all_tiles()
+        if not tiles:
+            continue
+        if i % 7 == 3:
+            board.corrupt_tile(random.choice(tiles).tile_id)
+            board.spread_corruption(0.5)
+        if i % 11 == 5:
+            board.remove_tile(random.choice(tiles).position)
+    
+    assert board.corrupted_tiles
+    for position in all_positions():
+        assert board.is_position_movable(position) == tile_level_movable(board, position)
+
+def test_flagged_and_removed_tiles_block_movement():
+    board = Board()
+    tile = PathTile(tile_id="east", tile_type=PathTileType.BASIC, position=TilePosition(3, 2, 2))
+    assert board.place_tile(tile)
+    sub_x, sub_y = next(iter(tile.movable_positions))
+    position = Position(3, 2, sub_x, sub_y, 2)
+    assert board.is_position_movable(position)
+    
+    board.remove_tile(TilePosition(3, 2, 2))
+    assert not board.is_position_movable(position)
+    
+    # A tile placed with is_corrupted set cannot be entered
+    flagged = PathTile(tile_id="east2", tile_type=PathTileType.BASIC, position=TilePosition(3, 2, 2), is_corrupted=True)
+    assert board.place_tile(flagged)
+    assert not board.is_position_movable(position)
+
+def test_corruption_spread_does_not_block_movement():
+    board = Board()
+    tile = PathTile(tile_id="east", tile_type=PathTileType.BASIC, position=TilePosition(3, 2, 2))
+    assert board.place_tile(tile)
+    position = Position(3, 2, *next(iter(tile.movable_positions)), 2)
+    
+    # Corruption is tracked per board in corrupted_tiles; as before, it does not flag the tile
+    assert board.corrupt_tile("east")
+    assert "east" in board.corrupted_tiles
+    assert not tile.is_corrupted
+    assert board.is_position_movable(position)
+    assert board.find_path(Position(2, 2, 0, 0, 2), position)
+
+def random_board(seed):
+    random.seed(seed)
+    board = Board()
+    for i in range(50):
+        board.place_tile(PathTile(tile_id=f"t{i}", tile_type=random.choice([PathTileType.BASIC, PathTileType.STAIRWELL]),
+                                  position=TilePosition(random.randrange(BOARD_SIZE[0]), random.randrange(BOARD_SIZE[1]),
+                                                        random.choice([1, 2, 2, 3])),
+                                  is_corrupted=random.random() < 0.1))
+    return board
+
+def open_cells(board):
+    return [Position(x, y, sub_x, sub_y, floor)
+            for floor, floor_tiles in board.floors.items()
+            for (x, y), tile in floor_tiles.items()
+            for sub_x in range(4)
+            for sub_y in range(4)
+            if not tile.is_corrupted]
+
+@pytest.mark.parametrize("seed", range(6))
+def test_find_path_steps_between_neighbouring_squares_of_intact_tiles(seed):
+    board = random_board(seed)
+    cells = open_cells(board)
+    for _ in range(25):
+        start, end = random.choice(cells), random.choice(cells)
+        path = board.find_path(start, end)
+        if path is None:
+            continue
+        assert path[0] == start and path[-1] == end
+        for step, next_step in zip(path, path[1:]):
+            assert next_step in step.get_adjacent_positions()
+            tile = board.get_tile(next_step)
+            assert tile and not tile.is_corrupted
+
+def test_find_path_start_is_goal():
+    board = Board()
+    start = open_cells(board)[0]
+    assert board.find_path(start, start) == [start]
+
+def test_find_path_walks_any_square_of_an_intact_tile():
+    board = Board()
+    tile = PathTile(tile_id="east", tile_type=PathTileType.BASIC, position=TilePosition(3, 2, 2),
+                    movable_positions={(0, 0)})
+    assert board.place_tile(tile)
+    
+    # find_path only needs an intact tile; movable_positions is not consulted
+    goal = Position(3, 2, 3, 3, 2)
+    assert not board.is_position_movable(goal)
+    path = board.find_path(Position(2, 2, 0, 0, 2), goal)
+    assert path and path[-1] == goal
+
+def test_find_path_unreachable_goal():
+    board = Board()
+    assert board.place_tile(PathTile(tile_id="east", tile_type=PathTileType.BASIC, position=TilePosition(3, 2, 2),
+                                     is_corrupted=True))
+    start = open_cells(board)[0]
+    
+    # Corrupted tiles block the way, and empty board positions have nothing to stand on
+    assert board.find_path(start, Position(3, 2, 1, 1, 2)) is None
+    assert board.find_path(start, Position(0, 0, 0, 0, 4)) is None
@@ -0,0 +1,52 @@
+"""
+Tests for the numeric kernels, run both compiled and as plain Python.
+"""
+
+import pytest
+
+from game_logic import _fast
+from game_logic._fast import CELL_EMPTY, CELL_TILE, CELL_CORRUPTED
+
+FLOORS, HEIGHT, WIDTH = 2, 4, 5
+
+# Floor 0 has a corrupted tile at (1, 1); floor 1 has one in the corner at (4, 3)
+TILES = [
+    CELL_TILE, CELL_TILE,      CELL_TILE,  CELL_EMPTY, CELL_TILE,
+    CELL_TILE, CELL_CORRUPTED, CELL_TILE,  CELL_TILE,  CELL_TILE,
+    CELL_TILE, CELL_TILE,      CELL_EMPTY, CELL_TILE,  CELL_TILE,
+    CELL_TILE, CELL_TILE,      CELL_TILE,  CELL_TILE,  CELL_TILE,
+    
+    CELL_TILE,  CELL_TILE,  CELL_TILE, CELL_TILE, CELL_TILE,
+    CELL_EMPTY, CELL_EMPTY, CELL_TILE, CELL_TILE, CELL_TILE,
+    CELL_TILE,  CELL_TILE,  CELL_TILE, CELL_TILE, CELL_TILE,
+    CELL_TILE,  CELL_TILE,  CELL_TILE, CELL_TILE, CELL_CORRUPTED,
+]
+
+@pytest.fixture(params=["numba", "python"])
+def kernels(request):
+    """The compiled module, or a copy of it loaded without Numba"""
+    if request.param == "numba":
+        if not _fast.HAVE_NUMBA:
+            pytest.skip("Numba is not installed")
+        return _fast
+    return request.getfixturevalue("pure_fast")
+
+def load(kernels, values):
+    grid = kernels.new_grid(len(values))
+    for i, value in enumerate(values):
+        grid[i] = value
+    return grid
+
+def test_mark_corruption_candidates(kernels):
+    out = kernels.new_grid(len(TILES))
+    count = kernels.mark_corruption_candidates(load(kernels, TILES), out, FLOORS, HEIGHT, WIDTH)
+    
+    plane = HEIGHT * WIDTH
+    expected = [0] * len(TILES)
+    for i in (0, 1, 2, 5, 7, 10, 11):
+        expected[i] = 1
+    for x, y in ((3, 2), (4, 2), (3, 3)):
+        expected[plane + y * WIDTH + x] = 1
+    
+    assert [int(v) for v in out] == expected
+    assert count == sum(expected)
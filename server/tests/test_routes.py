@@ -0,0 +1,224 @@
+"""
+Tests for the SocketIO handlers: input validation, state deltas and resync snapshots.
+"""
+
+import json
+import logging
+import re
+
+import pytest
+
+from api import routes
+from api.routes import game_manager
+from run import create_app
+
+PAWN_POSITION = {'tile_x': 2, 'tile_y': 2, 'sub_x': 1, 'sub_y': 1, 'floor': 2}
+
+def regex_validate_player_name(name):
+    """The player name validator as written before the cached translate tables"""
+    if not name or not isinstance(name, str):
+        return False, "Player name is required"
+    
+    name = name.strip()
+    if len(name) < 2:
+        return False, "Player name must be at least 2 characters"
+    if len(name) > 20:
+        return False, "Player name must be 20 characters or less"
+    if not re.match(r'^[a-zA-Z0-9\s_-]+$', name):
+        return False, "Player name can only contain letters, numbers, spaces, hyphens, and underscores"
+    
+    return True, name
+
+def regex_validate_game_id(game_id):
+    """The game ID validator as written before the cached translate tables"""
+    if not game_id or not isinstance(game_id, str):
+        return False, "Game ID is required"
+    
+    game_id = game_id.strip().upper()
+    if len(game_id) != 6:
+        return False, "Game ID must be exactly 6 characters"
+    if not re.match(r'^[A-Z0-9]+$', game_id):
+        return False, "Game ID can only contain uppercase letters and numbers"
+    
+    return True, game_id
+
+PLAYER_NAMES = [
+    None, 42, "", " ", "\t\n", "a", " a ", "ab", "  ab  ", "Al", "al-bo_3", "Al Bo", "Al\tBo", "Al\nBo",
+    "a" * 20, "a" * 21, " " * 10 + "a" * 20 + " " * 10, "Al!", "Al.Bo", "Al/Bo", "-_", "__",
+    "Zoë", "Łukasz", "名前", "Al\u3000Bo", "Al\xa0Bo", "Al\u200bBo", "Al\x1cBo", "١٢٣", "\u3000Al\u3000",
+    # Longer than _MAX_CACHED_INPUT, so validated through __wrapped__ without caching
+    " " * 70 + "Al", "Al" + " " * 70, " " * 40 + "Player One" + " " * 40, "a" * 65, "名" * 65, "\u3000" * 65,
+]
+
+GAME_IDS = [
+    None, 123456, "", " ", "\t", "ABC123", "abc123", " ABC123 ", "AbC123", "ABC12", "ABC1234", "ABC-12", "ABC 12",
+    "ABC12\n", "ÄBC123", "ABC12ß", "ABCß1", "１２３４５６", "ＡBC123", "ABC\u3000123", "\u3000ABC123\u3000",
+    # Longer than _MAX_CACHED_INPUT, so validated through __wrapped__ without caching
+    " " * 70 + "ABC123", "abc123" + "\t" * 70, "A" * 65, " " * 30 + "ABC 123" + " " * 30, "ß" * 65,
+]
+
+def received(client, event):
+    """Payloads of every event of one name the client has received since the last call"""
+    return [packet['args'][0] for packet in client.get_received() if packet['name'] == event]
+
+def as_sent(state):
+    """A state as a client receives it (tuples arrive as lists, int keys as strings)"""
+    return json.loads(json.dumps(state))
+
+@pytest.fixture
+def socketio_app():
+    app, socketio = create_app()
+    return app, socketio
+
+@pytest.fixture
+def game(socketio_app):
+    """A game created by host and joined by guest, not yet started"""
+    app, socketio = socketio_app
+    host = socketio.test_client(app)
+    guest = socketio.test_client(app)
+    
+    host.emit('create_game', {'player_name': 'Host'})
+    game_id = received(host, 'game_created')[0]['game_id']
+    guest.emit('join_game', {'game_id': game_id, 'player_name': 'Guest'})
+    host.get_received()
+    guest.get_received()
+    
+    yield game_id, host, guest
+    host.disconnect()
+    guest.disconnect()
+
+def test_join_acks_the_joiner_and_notifies_the_others(socketio_app):
+    app, socketio = socketio_app
+    host = socketio.test_client(app)
+    guest = socketio.test_client(app)
+    
+    host.emit('create_game', {'player_name': 'Host'})
+    game_id = received(host, 'game_created')[0]['game_id']
+    guest.get_received()
+    guest.emit('join_game', {'game_id': game_id, 'player_name': 'Guest'})
+    
+    # The joiner gets its own ack straight back, not a copy of the room broadcast
+    guest_packets = guest.get_received()
+    assert [packet['name'] for packet in guest_packets] == ['game_joined']
+    ack = guest_packets[0]['args'][0]
+    assert ack['success'] and ack['game_id'] == game_id and ack['player_count'] == 2
+    
+    joined = received(host, 'player_joined')
+    assert len(joined) == 1
+    assert joined[0]['player_name'] == 'Guest' and joined[0]['player_count'] == 2
+    
+    host.disconnect()
+    guest.disconnect()
+
+def test_get_game_diff_sends_full_state_then_changed_keys(game):
+    game_id, host, guest = game
+    
+    seq, state = game_manager.get_game_diff(game_id)
+    assert state == game_manager.get_game_state(game_id)
+    
+    # Nothing changed since the last broadcast
+    assert game_manager.get_game_diff(game_id) == (seq + 1, {})
+    
+    game_manager.start_game(game_id, None)
+    started = game_manager.get_game_state(game_id)
+    next_seq, changed = game_manager.get_game_diff(game_id)
+    assert next_seq == seq + 2
+    assert changed
+    assert changed == {key: value for key, value in started.items() if state.get(key) != value}
+    
+    # A full broadcast still advances the sequence
+    assert game_manager.get_game_diff(game_id, full=True) == (seq + 3, started)
+
+def test_player_action_broadcasts_next_delta(game):
+    game_id, host, guest = game
+    
+    host.emit('start_game', {'game_id': game_id})
+    started = received(guest, 'game_started')[0]
+    host.get_received()
+    
+    # The first player is drawn at random, so let whoever holds the turn act
+    current_player = started['game_state']['current_player']
+    actor, other = (host, guest) if current_player == started['game_state']['host'] else (guest, host)
+    actor.emit('player_action', {'action_type': 'place_pawn', 'action_data': {'target_position': PAWN_POSITION}})
+    actor_delta = received(actor, 'game_state_delta')[0]
+    other_delta = received(other, 'game_state_delta')[0]
+    
+    # Both players get the same delta; the actor recognises its ack by sid
+    assert other_delta == actor_delta
+    assert actor_delta['actor'] == current_player
+    assert actor_delta['action_result']['success']
+    assert actor_delta['seq'] == started['seq'] + 1
+    assert set(actor_delta['changed']) < set(started['game_state'])
+    
+    # Applying the delta to the started state gives the current state
+    state = dict(started['game_state'], **actor_delta['changed'])
+    other.emit('get_game_state', {'game_id': game_id})
+    assert received(other, 'game_state_update')[0]['game_state'] == state
+
+def test_get_game_state_returns_last_broadcast_with_its_seq(game):
+    game_id, host, guest = game
+    
+    # Before any broadcast the snapshot is the full state at seq 0
+    guest.emit('get_game_state', {'game_id': game_id})
+    update = received(guest, 'game_state_update')[0]
+    assert update['seq'] == 0
+    assert update['game_state'] == as_sent(game_manager.get_game_state(game_id))
+    
+    host.emit('start_game', {'game_id': game_id})
+    started = received(guest, 'game_started')[0]
+    
+    # State changes that were not broadcast yet stay out of the snapshot
+    game_manager.games[game_id].state_version += 1
+    game_manager.games[game_id].turn_number += 1
+    guest.emit('get_game_state', {'game_id': game_id})
+    update = received(guest, 'game_state_update')[0]
+    assert update['seq'] == started['seq']
+    assert update['game_state'] == started['game_state']
+    seq, state = game_manager.get_last_broadcast(game_id)
+    assert (seq, as_sent(state)) == (started['seq'], started['game_state'])
+    
+    guest.emit('get_game_state', {'game_id': 'NOGAME'})
+    assert received(guest, 'error')
+
+@pytest.mark.parametrize("name", PLAYER_NAMES)
+def test_validate_player_name_matches_regex_validator(name):
+    assert routes.validate_player_name(name) == regex_validate_player_name(name)
+    # A second call is answered from the cache (or revalidated for long inputs) with the same result
+    assert routes.validate_player_name(name) == regex_validate_player_name(name)
+
+@pytest.mark.parametrize("game_id", GAME_IDS)
+def test_validate_game_id_matches_regex_validator(game_id):
+    assert routes.validate_game_id(game_id) == regex_validate_game_id(game_id)
+    assert routes.validate_game_id(game_id) == regex_validate_game_id(game_id)
+
+def test_long_inputs_are_not_cached():
+    routes._check_player_name.cache_clear()
+    routes._check_game_id.cache_clear()
+    
+    long_name = " " * routes._MAX_CACHED_INPUT + "Al"
+    long_id = "abc123" + " " * routes._MAX_CACHED_INPUT
+    assert routes.validate_player_name(long_name) == (True, "Al")
+    assert routes.validate_game_id(long_id) == (True, "ABC123")
+    assert routes._check_player_name.cache_info().currsize == 0
+    assert routes._check_game_id.cache_info().currsize == 0
+    
+    # Inputs up to the limit are cached
+    routes.validate_player_name(long_name[-routes._MAX_CACHED_INPUT:])
+    routes.validate_game_id(long_id[:routes._MAX_CACHED_INPUT])
+    assert routes._check_player_name.cache_info().currsize == 1
+    assert routes._check_game_id.cache_info().currsize == 1
+
+def test_handler_failure_is_logged_once(socketio_app, caplog):
+    app, socketio = socketio_app
+    client = socketio.test_client(app)
+    client.get_received()
+    
+    # A non-dict payload makes handle_start_game raise
+    with caplog.at_level(logging.ERROR, logger=routes.log.name):
+        client.emit('start_game', None)
+    
+    assert len([record for record in caplog.records if record.name == routes.log.name]) == 1
+    error = received(client, 'error')[0]
+    assert error['message'].startswith("Failed to start game: ")
+    assert error['code'] == "SERVER_ERROR"
+    client.disconnect()